@@ -5,23 +5,83 @@ True recursive turtle spawning within single Claude conversation
 No external API calls - pure internal delegation and coordination
 """
 
+import atexit
 import json
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from enum import Enum
+from enum import IntFlag, auto
 
-class TurtleState(Enum):
-    DORMANT = "dormant"
-    ACTIVE = "active" 
-    DELEGATING = "delegating"
-    REPORTING = "reporting"
-    COMPLETED = "completed"
+class TurtleState(IntFlag):
+    """Power-of-two states so filter passes compare via integer bitmask"""
+    DORMANT = auto()
+    ACTIVE = auto()
+    DELEGATING = auto()
+    REPORTING = auto()
+    COMPLETED = auto()
 
-@dataclass
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+class TurtleLog:
+    """Buffered turtle log
+
+    Bare print() flushes line-by-line and serializes threads on the
+    stdout lock; this batches messages and writes them in one syscall.
+    """
+
+    def __init__(self, stream=None, batch_size: int = 64):
+        self.stream = stream if stream is not None else sys.stdout
+        self.batch_size = batch_size
+        self.buffer: List[str] = []
+        self.lock = threading.Lock()
+
+    def emit(self, message: str):
+        with self.lock:
+            self.buffer.append(message)
+            if len(self.buffer) >= self.batch_size:
+                self._flush_locked()
+
+    def flush(self):
+        with self.lock:
+            if self.buffer:
+                self._flush_locked()
+
+    def _flush_locked(self):
+        self.stream.write("\n".join(self.buffer) + "\n")
+        self.buffer.clear()
+
+log = TurtleLog()
+atexit.register(log.flush)
+
+_TIMESTAMP_CACHE: Tuple[float, str] = (0.0, "")
+
+def _batch_timestamp(resolution: float = 0.01) -> str:
+    """ISO timestamp cached for `resolution` seconds
+
+    Turtles spawned in the same batch share one formatted string instead
+    of paying a utcnow() + isoformat() call each.
+    """
+    global _TIMESTAMP_CACHE
+    now = time.monotonic()
+    cached_at, stamp = _TIMESTAMP_CACHE
+    if not stamp or now - cached_at > resolution:
+        stamp = datetime.utcnow().isoformat()
+        _TIMESTAMP_CACHE = (now, stamp)
+    return stamp
+
+@dataclass(slots=True)
 class InternalTurtle:
-    """Internal turtle that exists within the same conversation context"""
+    """Internal turtle that exists within the same conversation context
+
+    slots=True drops the per-instance __dict__ - roughly half the memory
+    per turtle and faster attribute access on large fleets.
+    """
     id: str
     name: str
     specialization: str
@@ -32,14 +92,14 @@ class InternalTurtle:
     capabilities: List[str] = field(default_factory=list)
     sub_turtles: List['InternalTurtle'] = field(default_factory=list)
     results: Dict[str, Any] = field(default_factory=dict)
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = field(default_factory=_batch_timestamp)
     
     def activate(self):
         """Activate this turtle to work on its mission"""
         self.state = TurtleState.ACTIVE
-        print(f"🐢 {self.id} ACTIVATED")
-        print(f"🎯 Mission: {self.mission}")
-        print(f"💪 Specialization: {self.specialization}")
+        log.emit(f"🐢 {self.id} ACTIVATED")
+        log.emit(f"🎯 Mission: {self.mission}")
+        log.emit(f"💪 Specialization: {self.specialization}")
         
     def spawn_sub_turtle(self, name: str, specialization: str, mission: str) -> 'InternalTurtle':
         """Spawn a sub-turtle for delegation"""
@@ -56,8 +116,8 @@ class InternalTurtle:
         self.sub_turtles.append(sub_turtle)
         self.state = TurtleState.DELEGATING
         
-        print(f"🥚 {self.id} spawned {sub_id}")
-        print(f"📊 Generation: G{sub_turtle.generation}")
+        log.emit(f"🥚 {self.id} spawned {sub_id}")
+        log.emit(f"📊 Generation: G{sub_turtle.generation}")
         
         return sub_turtle
     
@@ -65,19 +125,50 @@ class InternalTurtle:
         """Mark mission as completed with results"""
         self.results = results
         self.state = TurtleState.COMPLETED
-        print(f"✅ {self.id} MISSION COMPLETE")
+        log.emit(f"✅ {self.id} MISSION COMPLETE")
         
         # Report back to parent if exists
         if self.parent_id:
             self.state = TurtleState.REPORTING
-            print(f"📋 Reporting to parent: {self.parent_id}")
+            log.emit(f"📋 Reporting to parent: {self.parent_id}")
+
+class WorkStealingDeques:
+    """Per-worker task deques with work stealing
+
+    Owners pop from the right (LIFO, cache-warm tasks), thieves steal
+    from the left (FIFO, oldest tasks) - the Arora/Chase-Lev invariant.
+    """
+
+    def __init__(self, num_workers: int):
+        from collections import deque
+        self.deques = [deque() for _ in range(num_workers)]
+        self.condition = threading.Condition()
+
+    def push(self, worker: int, item):
+        with self.condition:
+            self.deques[worker].append(item)
+            self.condition.notify()
+
+    def take(self, worker: int):
+        """Pop own work (LIFO) or steal from a busy worker (FIFO)"""
+        with self.condition:
+            if self.deques[worker]:
+                return self.deques[worker].pop()
+            for victim in self.deques:
+                if victim:
+                    return victim.popleft()
+        return None
 
 class InternalTurtleFleet:
     """Manages internal turtle fleet within single conversation"""
-    
+
     def __init__(self):
         self.turtles: Dict[str, InternalTurtle] = {}
         self.active_turtle_stack: List[str] = []
+        self._active_set: set = set()  # O(1) membership beside the ordered stack
+        self._turtles_lock = threading.Lock()
+        self._fleet_version = 0
+        self._hierarchy_cache: Optional[Tuple[int, Dict[str, Any]]] = None
         self.prime_turtle = self._create_prime_turtle()
         
     def _create_prime_turtle(self) -> InternalTurtle:
@@ -94,6 +185,7 @@ class InternalTurtleFleet:
         prime.activate()
         self.turtles["PRIME"] = prime
         self.active_turtle_stack.append("PRIME")
+        self._active_set.add("PRIME")
         return prime
     
     def spawn_turtle(self, name: str, specialization: str, mission: str, 
@@ -104,26 +196,29 @@ class InternalTurtleFleet:
         
         parent = self.turtles[parent_id]
         new_turtle = parent.spawn_sub_turtle(name, specialization, mission)
-        
-        # Register in fleet
-        self.turtles[new_turtle.id] = new_turtle
-        
+
+        # Register in fleet (lock held only for the dict insert)
+        with self._turtles_lock:
+            self.turtles[new_turtle.id] = new_turtle
+            self._fleet_version += 1
+
         return new_turtle
     
     def activate_turtle(self, turtle_id: str):
         """Switch conversation context to specific turtle"""
-        if turtle_id not in self.turtles:
+        turtle = self.turtles.get(turtle_id)
+        if turtle is None:
             raise ValueError(f"Turtle {turtle_id} not found")
-        
-        turtle = self.turtles[turtle_id]
+
         turtle.activate()
-        
-        # Update active stack
-        if turtle_id not in self.active_turtle_stack:
+
+        # Update active stack (set mirror keeps membership O(1))
+        if turtle_id not in self._active_set:
             self.active_turtle_stack.append(turtle_id)
+            self._active_set.add(turtle_id)
         
-        print(f"🔄 CONTEXT SWITCH → {turtle_id}")
-        print(f"📚 Active turtle stack: {' → '.join(self.active_turtle_stack)}")
+        log.emit(f"🔄 CONTEXT SWITCH → {turtle_id}")
+        log.emit(f"📚 Active turtle stack: {' → '.join(self.active_turtle_stack)}")
     
     def current_turtle(self) -> InternalTurtle:
         """Get currently active turtle"""
@@ -133,12 +228,11 @@ class InternalTurtleFleet:
     
     def delegate_to_turtle(self, turtle_id: str, task: str) -> str:
         """Delegate specific task to turtle and get result"""
-        if turtle_id not in self.turtles:
+        turtle = self.turtles.get(turtle_id)
+        if turtle is None:
             raise ValueError(f"Turtle {turtle_id} not found")
-        
-        turtle = self.turtles[turtle_id]
-        
-        print(f"📋 DELEGATING to {turtle_id}: {task}")
+
+        log.emit(f"📋 DELEGATING to {turtle_id}: {task}")
         
         # Simulate internal turtle processing
         # In reality, this would be the conversation continuing as that turtle
@@ -156,84 +250,142 @@ Capabilities: {turtle.capabilities}
         
         # Mark as completed (in real implementation, turtle would do actual work)
         turtle.complete_mission({"task": task, "status": "completed"})
-        
+        self._fleet_version += 1  # state changed, hierarchy snapshot is stale
+
         return delegation_result
     
     def parallel_delegation(self, tasks: List[Dict[str, str]]) -> List[str]:
-        """Delegate multiple tasks to different turtles in parallel (conceptually)"""
-        results = []
-        
-        print(f"🌊 PARALLEL DELEGATION: {len(tasks)} tasks")
-        
+        """Delegate multiple tasks to different turtles in parallel"""
+        log.emit(f"🌊 PARALLEL DELEGATION: {len(tasks)} tasks")
+
+        # Spawn turtles up front, then delegate concurrently - each
+        # delegation is independent and I/O-bound, so total wall-clock
+        # drops from sum(t_i) toward max(t_i)
+        work: List[Tuple[int, str, str]] = []
         for i, task_spec in enumerate(tasks):
-            # Spawn or use existing turtle for each task
             turtle_name = task_spec.get("turtle_name", f"TaskTurtle{i+1}")
             specialization = task_spec.get("specialization", "general_task")
             task = task_spec["task"]
-            
-            # Spawn turtle if doesn't exist
+
             turtle_id = f"PRIME_SUB_{i+1}"
             if turtle_id not in self.turtles:
                 turtle = self.spawn_turtle(turtle_name, specialization, task)
                 turtle_id = turtle.id
-            
-            # Delegate task
-            result = self.delegate_to_turtle(turtle_id, task)
-            results.append(result)
-        
+
+            work.append((i, turtle_id, task))
+
+        if not work:
+            return []
+
+        num_workers = min(32, len(work))
+        deques = WorkStealingDeques(num_workers)
+        for i, turtle_id, task in work:
+            deques.push(i % num_workers, (i, turtle_id, task))
+
+        results: List[Optional[str]] = [None] * len(work)
+
+        def worker(worker_index: int):
+            while True:
+                item = deques.take(worker_index)
+                if item is None:
+                    return
+                i, turtle_id, task = item
+                results[i] = self.delegate_to_turtle(turtle_id, task)
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(worker, w) for w in range(num_workers)]
+            for future in futures:
+                future.result()
+
         return results
     
+    def iter_completed_results(self):
+        """Stream (turtle_id, results) pairs for completed turtles
+
+        Generator form - callers that only iterate never pay for a
+        materialized results dict.
+        """
+        for turtle_id, turtle in self.turtles.items():
+            if turtle.state & TurtleState.COMPLETED and turtle.results:
+                yield turtle_id, turtle.results
+
     def synthesize_results(self) -> Dict[str, Any]:
         """Synthesize all turtle results back to prime turtle"""
-        print("🔄 SYNTHESIZING RESULTS")
-        
-        all_results = {}
+        log.emit("🔄 SYNTHESIZING RESULTS")
+
+        # Structure-of-arrays snapshot: one pass over the fleet fills
+        # parallel columns, then aggregates read the columns instead of
+        # re-scanning turtle objects per statistic
+        ids: List[str] = []
+        states: List[TurtleState] = []
+        generations: List[int] = []
         for turtle_id, turtle in self.turtles.items():
-            if turtle.state == TurtleState.COMPLETED and turtle.results:
-                all_results[turtle_id] = turtle.results
-        
+            ids.append(turtle_id)
+            states.append(turtle.state)
+            generations.append(turtle.generation)
+
         synthesis = {
-            "total_turtles": len(self.turtles),
-            "completed_turtles": len([t for t in self.turtles.values() if t.state == TurtleState.COMPLETED]),
-            "max_generation": max(t.generation for t in self.turtles.values()),
-            "individual_results": all_results,
+            "total_turtles": len(ids),
+            "completed_turtles": sum(1 for state in states if state & TurtleState.COMPLETED),
+            "max_generation": max(generations),
+            # Materialized here for dict-indexing callers; streaming
+            # consumers should iterate iter_completed_results directly
+            "individual_results": dict(self.iter_completed_results()),
             "synthesis_timestamp": datetime.utcnow().isoformat()
         }
         
-        print(f"📊 Synthesis complete: {synthesis['completed_turtles']}/{synthesis['total_turtles']} turtles")
+        log.emit(f"📊 Synthesis complete: {synthesis['completed_turtles']}/{synthesis['total_turtles']} turtles")
         
         return synthesis
     
     def get_turtle_hierarchy(self) -> Dict[str, Any]:
-        """Get complete turtle hierarchy visualization"""
-        def build_tree(turtle_id: str) -> Dict[str, Any]:
-            turtle = self.turtles[turtle_id]
-            tree = {
+        """Get complete turtle hierarchy visualization
+
+        Memoized on the fleet version - repeated calls between spawns
+        reuse the prior tree instead of re-traversing every turtle.
+        """
+        if self._hierarchy_cache and self._hierarchy_cache[0] == self._fleet_version:
+            return self._hierarchy_cache[1]
+
+        # Explicit stack instead of recursion - no Python call-frame
+        # overhead and no recursion limit on deep turtle chains
+        def make_node(turtle: InternalTurtle) -> Dict[str, Any]:
+            return {
                 "id": turtle.id,
                 "name": turtle.name,
                 "specialization": turtle.specialization,
                 "generation": turtle.generation,
-                "state": turtle.state.value,
-                "children": [build_tree(sub.id) for sub in turtle.sub_turtles]
+                "state": turtle.state.label,
+                "children": []
             }
-            return tree
-        
-        return build_tree("PRIME")
+
+        root = self.turtles["PRIME"]
+        hierarchy = make_node(root)
+        stack: List[Tuple[InternalTurtle, Dict[str, Any]]] = [(root, hierarchy)]
+        while stack:
+            turtle, node = stack.pop()
+            for sub in turtle.sub_turtles:
+                child = make_node(sub)
+                node["children"].append(child)
+                stack.append((sub, child))
+
+        self._hierarchy_cache = (self._fleet_version, hierarchy)
+        return hierarchy
     
     def demonstrate_recursive_processing(self):
         """Demonstrate internal recursive turtle processing"""
-        print("🐢 INTERNAL RECURSIVE TURTLE DEMONSTRATION")
-        print("=" * 60)
+        log.emit("🐢 INTERNAL RECURSIVE TURTLE DEMONSTRATION")
+        log.emit("=" * 60)
         
         # Prime turtle identifies complex task needing delegation
-        print("\n1️⃣ PRIME TURTLE TASK ANALYSIS:")
+        log.emit("\n1️⃣ PRIME TURTLE TASK ANALYSIS:")
         complex_mission = "Implement turtle property management system with multi-provider support"
         
-        print(f"Mission: {complex_mission}")
-        print("Complexity assessment: Requires multiple specializations")
+        log.emit(f"Mission: {complex_mission}")
+        log.emit("Complexity assessment: Requires multiple specializations")
         
         # Spawn specialist turtles
-        print("\n2️⃣ SPAWNING SPECIALIST TURTLES:")
+        log.emit("\n2️⃣ SPAWNING SPECIALIST TURTLES:")
         
         property_turtle = self.spawn_turtle(
             "PropertyAnalyst", 
@@ -254,7 +406,7 @@ Capabilities: {turtle.capabilities}
         )
         
         # Delegate tasks in parallel (conceptually)
-        print("\n3️⃣ PARALLEL TASK DELEGATION:")
+        log.emit("\n3️⃣ PARALLEL TASK DELEGATION:")
         
         tasks = [
             {
@@ -277,23 +429,27 @@ Capabilities: {turtle.capabilities}
         results = self.parallel_delegation(tasks)
         
         # Show turtle hierarchy
-        print("\n4️⃣ TURTLE HIERARCHY:")
+        log.emit("\n4️⃣ TURTLE HIERARCHY:")
         hierarchy = self.get_turtle_hierarchy()
         self._print_hierarchy(hierarchy, 0)
         
         # Synthesize results
-        print("\n5️⃣ RESULT SYNTHESIS:")
+        log.emit("\n5️⃣ RESULT SYNTHESIS:")
         synthesis = self.synthesize_results()
         
         return synthesis
     
     def _print_hierarchy(self, node: Dict[str, Any], depth: int):
-        """Print turtle hierarchy tree"""
-        indent = "  " * depth
-        print(f"{indent}🐢 {node['id']} ({node['specialization']}) - {node['state']}")
-        
-        for child in node['children']:
-            self._print_hierarchy(child, depth + 1)
+        """Print turtle hierarchy tree (iterative, depth-first)"""
+        stack = [(node, depth)]
+        while stack:
+            current, current_depth = stack.pop()
+            indent = "  " * current_depth
+            log.emit(f"{indent}🐢 {current['id']} ({current['specialization']}) - {current['state']}")
+
+            # Reversed so children print in original order off the stack
+            for child in reversed(current['children']):
+                stack.append((child, current_depth + 1))
 
 def main():
     """Demonstrate internal recursive turtle system"""
@@ -302,13 +458,13 @@ def main():
     # Run demonstration
     results = fleet.demonstrate_recursive_processing()
     
-    print("\n" + "=" * 60)
-    print("🎉 INTERNAL RECURSIVE TURTLE SYSTEM COMPLETE!")
-    print("✅ No external API calls required")
-    print("✅ Perfect state sharing within conversation")
-    print("✅ Instant turtle coordination")
-    print("✅ Zero additional cost")
-    print(f"📊 Final synthesis: {len(results['individual_results'])} specialized results")
+    log.emit("\n" + "=" * 60)
+    log.emit("🎉 INTERNAL RECURSIVE TURTLE SYSTEM COMPLETE!")
+    log.emit("✅ No external API calls required")
+    log.emit("✅ Perfect state sharing within conversation")
+    log.emit("✅ Instant turtle coordination")
+    log.emit("✅ Zero additional cost")
+    log.emit(f"📊 Final synthesis: {len(results['individual_results'])} specialized results")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
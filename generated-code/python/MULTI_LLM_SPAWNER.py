@@ -5,35 +5,74 @@ Heterogeneous turtle fleet across different LLM providers
 Each turtle type optimally matched to best LLM provider
 """
 
+from __future__ import annotations
+
+import asyncio
 import json
 import requests
+import secrets
 import time
 import os
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Protocol
 from datetime import datetime
-from abc import ABC, abstractmethod
 
-class LLMProvider(ABC):
-    """Abstract base class for LLM providers"""
-    
-    @abstractmethod
-    def spawn_instance(self, turtle_spec: Dict) -> Optional[str]:
-        pass
-    
-    @abstractmethod
-    def get_capabilities(self) -> Dict:
-        pass
-    
-    @abstractmethod
-    def get_cost_per_token(self) -> Dict:
-        pass
+try:
+    # Optional like orjson below: the async spawn path wants it, but
+    # the sync spawns, fleet status and the threaded fallback don't
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        """Serialize request payloads with orjson (C-speed dumps)"""
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
-class ClaudeProvider(LLMProvider):
+class LLMProvider(Protocol):
+    """Structural interface for LLM providers
+
+    Providers are duck-typed - anything with these methods works, with
+    no ABC registration or abstract-dispatch overhead at call sites.
+    """
+
+    def spawn_instance(self, turtle_spec: Dict) -> Optional[str]: ...
+
+    def get_capabilities(self) -> Dict: ...
+
+    def get_cost_per_token(self) -> Dict: ...
+
+    async def spawn_instance_async(self, session: aiohttp.ClientSession, turtle_spec: Dict) -> Optional[str]: ...
+
+async def _spawn_in_thread(provider: LLMProvider, turtle_spec: Dict) -> Optional[str]:
+    """Async fallback - run a provider's blocking spawn in a worker thread"""
+    return await asyncio.to_thread(provider.spawn_instance, turtle_spec)
+
+class ClaudeProvider:
     def __init__(self):
         self.api_key = os.getenv('ANTHROPIC_API_KEY')
         self.api_base = "https://api.anthropic.com/v1"
         self.model = "claude-3-5-sonnet-20241022"
+        # Constant per-provider - build once instead of per spawn
+        self.headers = {
+            "x-api-key": self.api_key,
+            "content-type": "application/json",
+            "anthropic-version": "2023-06-01"
+        }
+        self.payload_template = {"model": self.model, "max_tokens": 4000}
+        # Persistent session: keep-alive reuses the TLS connection
+        # across spawns instead of a fresh handshake per request
+        self.session = requests.Session()
+        self.session.mount(self.api_base, requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=32))
     
+    @lru_cache(maxsize=1)
     def get_capabilities(self) -> Dict:
         return {
             "strengths": ["file_operations", "cnl_parsing", "context_retention", "complex_reasoning"],
@@ -51,23 +90,14 @@ class ClaudeProvider(LLMProvider):
         if not self.api_key:
             return self._manual_spawn_instructions(turtle_spec)
         
-        turtle_context = self._create_turtle_context(turtle_spec)
-        
-        headers = {
-            "x-api-key": self.api_key,
-            "content-type": "application/json",
-            "anthropic-version": "2023-06-01"
-        }
-        
-        payload = {
-            "model": self.model,
-            "max_tokens": 4000,
-            "system": turtle_context,
-            "messages": [{"role": "user", "content": f"turtle - {turtle_spec['id']} ready for mission"}]
-        }
+        payload = dict(
+            self.payload_template,
+            system=self._create_turtle_context(turtle_spec),
+            messages=[{"role": "user", "content": f"turtle - {turtle_spec['id']} ready for mission"}]
+        )
         
         try:
-            response = requests.post(f"{self.api_base}/messages", headers=headers, json=payload, timeout=30)
+            response = self.session.post(f"{self.api_base}/messages", headers=self.headers, data=_dumps(payload), timeout=30)
             if response.status_code == 200:
                 session_id = f"claude_{turtle_spec['id']}_{int(time.time())}"
                 print(f"✅ Claude turtle spawned: {turtle_spec['id']}")
@@ -77,25 +107,64 @@ class ClaudeProvider(LLMProvider):
         except Exception as e:
             print(f"❌ Claude spawn failed: {e}")
             return self._manual_spawn_instructions(turtle_spec)
-    
-    def _create_turtle_context(self, turtle_spec: Dict) -> str:
-        return f"""You are {turtle_spec['id']}, a Claude-based turtle specialized in {turtle_spec['specialization']}.
+
+    async def spawn_instance_async(self, session: aiohttp.ClientSession, turtle_spec: Dict) -> Optional[str]:
+        """Spawn Claude instance without blocking the event loop"""
+        if not self.api_key:
+            return self._manual_spawn_instructions(turtle_spec)
+
+        payload = dict(
+            self.payload_template,
+            system=self._create_turtle_context(turtle_spec),
+            messages=[{"role": "user", "content": f"turtle - {turtle_spec['id']} ready for mission"}]
+        )
+
+        try:
+            async with session.post(f"{self.api_base}/messages", headers=self.headers, data=_dumps(payload),
+                                    timeout=aiohttp.ClientTimeout(total=30)) as response:
+                if response.status == 200:
+                    session_id = f"claude_{turtle_spec['id']}_{int(time.time())}"
+                    print(f"✅ Claude turtle spawned: {turtle_spec['id']}")
+                    return session_id
+                return self._manual_spawn_instructions(turtle_spec)
+        except Exception as e:
+            print(f"❌ Claude spawn failed: {e}")
+            return self._manual_spawn_instructions(turtle_spec)
+
+    # Parsed once at class definition; _create_turtle_context only fills
+    # the per-turtle fields via format_map
+    CONTEXT_TEMPLATE = """You are {id}, a Claude-based turtle specialized in {specialization}.
 
 🐢 **Claude Turtle Identity:**
 - **Provider**: Claude 3.5 Sonnet (Anthropic)
 - **Strengths**: File operations, CNL parsing, complex reasoning
 - **Tools**: Full turtle tool suite (Read, Write, Edit, Bash, etc.)
-- **Mission**: {turtle_spec['mission']}
+- **Mission**: {mission}
 
 You have native tool calling capabilities and excel at file manipulation and turtle coordination tasks.
 """
 
-class OpenAIProvider(LLMProvider):
+    def _create_turtle_context(self, turtle_spec: Dict) -> str:
+        return self.CONTEXT_TEMPLATE.format_map(turtle_spec)
+
+class OpenAIProvider:
     def __init__(self):
         self.api_key = os.getenv('OPENAI_API_KEY')
         self.api_base = "https://api.openai.com/v1"
         self.model = "gpt-4-turbo"
+        # Constant per-provider - build once instead of per spawn
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        self.payload_template = {"model": self.model, "max_tokens": 4000}
+        # Persistent session: keep-alive reuses the TLS connection
+        # across spawns instead of a fresh handshake per request
+        self.session = requests.Session()
+        self.session.mount(self.api_base, requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=32))
     
+    @lru_cache(maxsize=1)
     def get_capabilities(self) -> Dict:
         return {
             "strengths": ["function_calling", "json_processing", "api_integration", "structured_output"],
@@ -113,28 +182,22 @@ class OpenAIProvider(LLMProvider):
         if not self.api_key:
             return self._manual_spawn_instructions(turtle_spec)
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "model": self.model,
-            "messages": [
+        payload = dict(
+            self.payload_template,
+            messages=[
                 {
-                    "role": "system", 
+                    "role": "system",
                     "content": self._create_turtle_context(turtle_spec)
                 },
                 {
                     "role": "user",
                     "content": f"Initialize turtle {turtle_spec['id']} and begin mission"
                 }
-            ],
-            "max_tokens": 4000
-        }
+            ]
+        )
         
         try:
-            response = requests.post(f"{self.api_base}/chat/completions", headers=headers, json=payload)
+            response = self.session.post(f"{self.api_base}/chat/completions", headers=self.headers, data=_dumps(payload))
             if response.status_code == 200:
                 session_id = f"openai_{turtle_spec['id']}_{int(time.time())}"
                 print(f"✅ OpenAI turtle spawned: {turtle_spec['id']}")
@@ -144,24 +207,59 @@ class OpenAIProvider(LLMProvider):
         except Exception as e:
             print(f"❌ OpenAI spawn failed: {e}")
             return self._manual_spawn_instructions(turtle_spec)
-    
-    def _create_turtle_context(self, turtle_spec: Dict) -> str:
-        return f"""You are {turtle_spec['id']}, an OpenAI GPT-4 based turtle specialized in {turtle_spec['specialization']}.
+
+    async def spawn_instance_async(self, session: aiohttp.ClientSession, turtle_spec: Dict) -> Optional[str]:
+        """Spawn OpenAI instance without blocking the event loop"""
+        if not self.api_key:
+            return self._manual_spawn_instructions(turtle_spec)
+
+        payload = dict(
+            self.payload_template,
+            messages=[
+                {
+                    "role": "system",
+                    "content": self._create_turtle_context(turtle_spec)
+                },
+                {
+                    "role": "user",
+                    "content": f"Initialize turtle {turtle_spec['id']} and begin mission"
+                }
+            ]
+        )
+
+        try:
+            async with session.post(f"{self.api_base}/chat/completions", headers=self.headers, data=_dumps(payload)) as response:
+                if response.status == 200:
+                    session_id = f"openai_{turtle_spec['id']}_{int(time.time())}"
+                    print(f"✅ OpenAI turtle spawned: {turtle_spec['id']}")
+                    return session_id
+                return self._manual_spawn_instructions(turtle_spec)
+        except Exception as e:
+            print(f"❌ OpenAI spawn failed: {e}")
+            return self._manual_spawn_instructions(turtle_spec)
+
+    # Parsed once at class definition; _create_turtle_context only fills
+    # the per-turtle fields via format_map
+    CONTEXT_TEMPLATE = """You are {id}, an OpenAI GPT-4 based turtle specialized in {specialization}.
 
 🐢 **OpenAI Turtle Identity:**
 - **Provider**: GPT-4 Turbo (OpenAI)
 - **Strengths**: Function calling, JSON processing, API integration
 - **Tools**: Function calls, structured responses, external API access
-- **Mission**: {turtle_spec['mission']}
+- **Mission**: {mission}
 
 You excel at API integration, structured data processing, and external service coordination.
 """
 
-class BedrockProvider(LLMProvider):
+    def _create_turtle_context(self, turtle_spec: Dict) -> str:
+        return self.CONTEXT_TEMPLATE.format_map(turtle_spec)
+
+class BedrockProvider:
     def __init__(self):
         self.region = "us-east-1"
         self.model_id = "anthropic.claude-3-5-sonnet-20241022-v2:0"
     
+    @lru_cache(maxsize=1)
     def get_capabilities(self) -> Dict:
         return {
             "strengths": ["enterprise_compliance", "aws_integration", "cost_optimization", "regional_availability"],
@@ -180,11 +278,15 @@ class BedrockProvider(LLMProvider):
         print(f"🏢 Bedrock turtle spawn: {turtle_spec['id']} (enterprise mode)")
         return f"bedrock_{turtle_spec['id']}_{int(time.time())}"
 
-class LocalLLMProvider(LLMProvider):
+    async def spawn_instance_async(self, session: aiohttp.ClientSession, turtle_spec: Dict) -> Optional[str]:
+        return await _spawn_in_thread(self, turtle_spec)
+
+class LocalLLMProvider:
     def __init__(self):
         self.model = "llama-3-70b"
         self.ollama_url = "http://localhost:11434"
     
+    @lru_cache(maxsize=1)
     def get_capabilities(self) -> Dict:
         return {
             "strengths": ["privacy", "offline_operation", "no_rate_limits", "cost_free"],
@@ -202,6 +304,58 @@ class LocalLLMProvider(LLMProvider):
         print(f"🏠 Local LLM turtle spawn: {turtle_spec['id']} (privacy mode)")
         return f"local_{turtle_spec['id']}_{int(time.time())}"
 
+    async def spawn_instance_async(self, session: aiohttp.ClientSession, turtle_spec: Dict) -> Optional[str]:
+        return await _spawn_in_thread(self, turtle_spec)
+
+class AhoCorasickMatcher:
+    """Minimal Aho-Corasick automaton for multi-pattern substring search
+
+    One pass over the text finds every pattern it contains - O(len(text))
+    instead of O(patterns * len(text)) for repeated `in` scans.
+    """
+
+    def __init__(self, patterns: List[str]):
+        from collections import deque
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[set] = [set()]
+
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(set())
+                state = nxt
+            self.output[state].add(index)
+
+        # Breadth-first failure links
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fail = self.fail[state]
+                while fail and ch not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[nxt] = self.goto[fail].get(ch, 0)
+                self.output[nxt] |= self.output[self.fail[nxt]]
+
+    def find_matches(self, text: str) -> set:
+        """Return the indices of all patterns occurring in text"""
+        state = 0
+        matched: set = set()
+        for ch in text:
+            while state and ch not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(ch, 0)
+            matched |= self.output[state]
+        return matched
+
 class MultiLLMTurtleSpawner:
     def __init__(self):
         self.providers = {
@@ -233,20 +387,44 @@ class MultiLLMTurtleSpawner:
             "high_volume": "local",
             "research": "local"
         }
-    
+
+        # Compiled once - pattern matching in select_optimal_provider is
+        # a single automaton pass over the specialization string
+        self._spec_patterns = list(self.specialization_to_provider)
+        self._spec_matcher = AhoCorasickMatcher(self._spec_patterns)
+
+        # Runtime-codegen one id builder per provider: the provider tag
+        # is baked into the compiled f-string as a constant, so the hot
+        # spawn path skips the per-call .upper() and concatenation setup.
+        # Suffix comes from secrets.token_hex - second-granularity
+        # time.time() collided for turtles spawned in the same second.
+        self._id_builders = {}
+        for provider_name in self.providers:
+            source = (
+                f"def _build_id(turtle_name):\n"
+                f"    return f\"{{turtle_name}}-{provider_name.upper()}-{{token_hex(4)}}\"\n"
+            )
+            namespace: Dict = {"token_hex": secrets.token_hex}
+            exec(compile(source, f"<id_builder:{provider_name}>", "exec"), namespace)
+            self._id_builders[provider_name] = namespace["_build_id"]
+
     def select_optimal_provider(self, turtle_spec: Dict) -> str:
         """Select best LLM provider for turtle specialization"""
-        specialization = turtle_spec['specialization'].lower()
-        
+        return self._provider_for_specialization(turtle_spec['specialization'].lower())
+
+    @lru_cache(maxsize=256)
+    def _provider_for_specialization(self, specialization: str) -> str:
+        """Resolve specialization to provider - cached, selection is pure"""
         # Direct match
         if specialization in self.specialization_to_provider:
             return self.specialization_to_provider[specialization]
-        
-        # Pattern matching
-        for spec_pattern, provider in self.specialization_to_provider.items():
-            if spec_pattern in specialization:
-                return provider
-        
+
+        # Pattern matching - single automaton pass; earliest-declared
+        # pattern wins, matching the old first-hit dict scan
+        matches = self._spec_matcher.find_matches(specialization)
+        if matches:
+            return self.specialization_to_provider[self._spec_patterns[min(matches)]]
+
         # Default to Claude for general turtle work
         return "claude"
     
@@ -254,15 +432,30 @@ class MultiLLMTurtleSpawner:
                                  mission: str, provider: str = "auto") -> Dict:
         """Spawn turtle on optimal or specified LLM provider"""
         
+        turtle_spec = self._build_turtle_spec(turtle_name, specialization, mission, provider)
+        provider = turtle_spec["provider"]
+
+        # Spawn on selected provider
+        session_id = self.providers[provider].spawn_instance(turtle_spec)
+        turtle_spec["session_id"] = session_id
+        
+        print(f"🌳 Heterogeneous spawn: {turtle_spec['id']}")
+        print(f"🎯 Provider: {provider} (optimal for {specialization})")
+        print(f"💪 Capabilities: {turtle_spec['provider_capabilities']['strengths']}")
+        
+        return turtle_spec
+
+    def _build_turtle_spec(self, turtle_name: str, specialization: str,
+                           mission: str, provider: str = "auto") -> Dict:
+        """Build turtle specification with provider resolution"""
         if provider == "auto":
             provider = self.select_optimal_provider({"specialization": specialization})
-        
+
         if provider not in self.providers:
             raise ValueError(f"Unknown provider: {provider}")
-        
-        # Create turtle specification
-        turtle_spec = {
-            "id": f"{turtle_name}-{provider.upper()}-{int(time.time()) % 10000}",
+
+        return {
+            "id": self._id_builders[provider](turtle_name),
             "name": turtle_name,
             "specialization": specialization,
             "mission": mission,
@@ -270,32 +463,74 @@ class MultiLLMTurtleSpawner:
             "provider_capabilities": self.providers[provider].get_capabilities(),
             "spawned_at": datetime.utcnow().isoformat()
         }
-        
-        # Spawn on selected provider
-        session_id = self.providers[provider].spawn_instance(turtle_spec)
-        turtle_spec["session_id"] = session_id
-        
-        print(f"🌳 Heterogeneous spawn: {turtle_spec['id']}")
-        print(f"🎯 Provider: {provider} (optimal for {specialization})")
-        print(f"💪 Capabilities: {turtle_spec['provider_capabilities']['strengths']}")
-        
-        return turtle_spec
-    
+
     def spawn_hybrid_tree(self, mission: str, tree_structure: Dict) -> Dict:
-        """Spawn complex turtle hierarchy across multiple LLM providers"""
+        """Spawn complex turtle hierarchy across multiple LLM providers concurrently"""
         print(f"🌳 HYBRID TREE SPAWNING: {mission}")
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            in_loop = False
+        else:
+            in_loop = True
+        if aiohttp is None or in_loop:
+            # No aiohttp, or already inside an event loop where
+            # asyncio.run would raise - batch the blocking spawns
+            # across a thread pool instead
+            spawned_tree = self._spawn_hybrid_tree_threaded(mission, tree_structure)
+        else:
+            spawned_tree = asyncio.run(self._spawn_hybrid_tree_async(mission, tree_structure))
+        print(f"🎉 Hybrid tree complete: {len(spawned_tree)} turtles across multiple LLMs")
+        return spawned_tree
+
+    def _spawn_hybrid_tree_threaded(self, mission: str, tree_structure: Dict) -> Dict:
+        """Thread-pool batch spawn - one worker per provider request"""
         spawned_tree = {}
-        
         for turtle_role, turtle_config in tree_structure.items():
-            turtle_spec = self.spawn_heterogeneous_turtle(
+            spawned_tree[turtle_role] = self._build_turtle_spec(
                 turtle_name=turtle_config["name"],
-                specialization=turtle_config["specialization"], 
+                specialization=turtle_config["specialization"],
                 mission=f"{mission} - {turtle_config['subtask']}",
                 provider=turtle_config.get("provider", "auto")
             )
-            spawned_tree[turtle_role] = turtle_spec
-        
-        print(f"🎉 Hybrid tree complete: {len(spawned_tree)} turtles across multiple LLMs")
+
+        with ThreadPoolExecutor(max_workers=min(32, len(spawned_tree) or 1)) as executor:
+            futures = {
+                turtle_role: executor.submit(
+                    self.providers[spec["provider"]].spawn_instance, spec)
+                for turtle_role, spec in spawned_tree.items()
+            }
+            for turtle_role, future in futures.items():
+                turtle_spec = spawned_tree[turtle_role]
+                turtle_spec["session_id"] = future.result()
+                print(f"🌳 Heterogeneous spawn: {turtle_spec['id']}")
+                print(f"🎯 Provider: {turtle_spec['provider']} (optimal for {turtle_spec['specialization']})")
+
+        return spawned_tree
+
+    async def _spawn_hybrid_tree_async(self, mission: str, tree_structure: Dict) -> Dict:
+        """Issue all provider spawns concurrently - total latency collapses
+        to roughly max(request_latency) instead of the serialized sum"""
+        spawned_tree = {}
+        for turtle_role, turtle_config in tree_structure.items():
+            spawned_tree[turtle_role] = self._build_turtle_spec(
+                turtle_name=turtle_config["name"],
+                specialization=turtle_config["specialization"],
+                mission=f"{mission} - {turtle_config['subtask']}",
+                provider=turtle_config.get("provider", "auto")
+            )
+
+        async with aiohttp.ClientSession() as session:
+            session_ids = await asyncio.gather(*(
+                self.providers[spec["provider"]].spawn_instance_async(session, spec)
+                for spec in spawned_tree.values()
+            ))
+
+        for turtle_spec, session_id in zip(spawned_tree.values(), session_ids):
+            turtle_spec["session_id"] = session_id
+            print(f"🌳 Heterogeneous spawn: {turtle_spec['id']}")
+            print(f"🎯 Provider: {turtle_spec['provider']} (optimal for {turtle_spec['specialization']})")
+
         return spawned_tree
     
     def get_fleet_status(self) -> Dict:
@@ -8,17 +8,65 @@ No dependency on Claude tooling - pure native turtle implementation
 import subprocess
 import json
 import os
+import queue
+import selectors
+import shutil
 import sys
 import time
 import signal
 import threading
 import socket
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 import argparse
 
+try:
+    import orjson
+
+    def _json_loads(data):
+        """Parse message bytes with orjson's C parser"""
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data).decode('utf-8')
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _json_dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Payloads above this ride shared memory; only the segment name crosses
+# the socket, so the kernel never copies the body through the stream
+_SHM_THRESHOLD = 1024
+
+def _publish_blob(data: bytes) -> Dict[str, Any]:
+    """Stash bytes in a SharedMemory segment, return its descriptor"""
+    shm = shared_memory.SharedMemory(create=True, size=len(data))
+    shm.buf[:len(data)] = data
+    shm.close()
+    return {"shm": shm.name, "size": len(data)}
+
+def _consume_blob(descriptor: Dict[str, Any]) -> bytes:
+    """Read and unlink a shared-memory payload published by a peer"""
+    shm = shared_memory.SharedMemory(name=descriptor["shm"])
+    try:
+        return bytes(shm.buf[:descriptor["size"]])
+    finally:
+        shm.close()
+        shm.unlink()
+
 class TurtleMode(Enum):
     PRIME = "prime"           # Prime turtle - fleet coordinator
     SPAWN = "spawn"           # Spawn new turtle process
@@ -34,9 +82,36 @@ class TurtleProcessSpec:
     llm_provider: str
     llm_model: str
     parent_pid: Optional[int] = None
-    communication_port: Optional[int] = None
+    # UDS is the default transport - loopback TCP pays full network-stack
+    # processing per message; AF_UNIX copies straight into the peer queue
+    socket_path: Optional[str] = None
+    use_tcp: bool = False
+    communication_port: Optional[int] = None  # TCP fallback (remote hosts)
+    # A backlog of 5 drops connections when a spawn burst of children
+    # all dial the prime turtle at once
+    listen_backlog: int = socket.SOMAXCONN
     working_directory: str = os.getcwd()
 
+_LOG_DIR = Path(".turtle/logs")
+
+def _daemon_log_files(name: str):
+    """Append-mode stdout/stderr log files for a long-running child
+
+    stdout=PIPE on a child nobody drains deadlocks it once the 64KB
+    pipe buffer fills; logging to files keeps the child running and
+    saves two pipe fds plus kernel buffer memory per process.
+    """
+    _LOG_DIR.mkdir(parents=True, exist_ok=True)
+    out = open(_LOG_DIR / f"{name}.out", "ab")
+    err = open(_LOG_DIR / f"{name}.err", "ab")
+    return out, err
+
+# CPython only takes the vfork/posix_spawn fast path when nothing
+# forces a full fork: no cwd or session change, an executable with a
+# dirname, and - before 3.13 - close_fds=False. Pass True only where
+# posix_spawn can honor it without silently falling back to fork+exec.
+_CLOSE_FDS_FAST = sys.version_info >= (3, 13)
+
 class NativeLLMInterface:
     """Native interface to LLM processes"""
     
@@ -45,6 +120,18 @@ class NativeLLMInterface:
         self.model = model
         self.process = None
         self.communication_port = None
+        # argv built once per (provider, model) - spawn paths reuse the
+        # lists instead of reconstructing them on every cold start
+        self._spawn_argv = {
+            # which() resolves to an absolute path - a bare name makes
+            # subprocess search PATH in the child, off the fast path
+            "ollama": [shutil.which("ollama") or "ollama", "serve"],
+            "local": ["./llama.cpp/main", "-m", self.model, "--port", "8080"],
+            "api": [sys.executable, str(Path(__file__).parent / "llm_api_wrapper.py"),
+                    "--provider", self.provider, "--model", self.model],
+            "mock": [sys.executable, "-c",
+                     "import time; print('🤖 Mock LLM started'); time.sleep(3600)"],
+        }
         
     def spawn_llm_process(self) -> subprocess.Popen:
         """Spawn native LLM process"""
@@ -66,54 +153,132 @@ class NativeLLMInterface:
     
     def _spawn_ollama_process(self) -> subprocess.Popen:
         """Spawn Ollama LLM process"""
-        cmd = ["ollama", "serve"]
+        cmd = self._spawn_argv["ollama"]
         env = os.environ.copy()
         env["OLLAMA_MODEL"] = self.model
         
+        out, err = _daemon_log_files(f"llm-ollama")
         return subprocess.Popen(
             cmd,
             env=env,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stdout=out,
+            stderr=err,
+            close_fds=_CLOSE_FDS_FAST
         )
     
     def _spawn_local_llm_process(self) -> subprocess.Popen:
         """Spawn local LLM process (e.g., llama.cpp)"""
-        cmd = ["./llama.cpp/main", "-m", self.model, "--port", "8080"]
+        cmd = self._spawn_argv["local"]
         
+        out, err = _daemon_log_files("llm-local")
         return subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stdout=out,
+            stderr=err,
+            close_fds=_CLOSE_FDS_FAST
         )
     
     def _spawn_api_wrapper_process(self) -> subprocess.Popen:
         """Spawn API wrapper process for external LLMs"""
         # This would be a lightweight API wrapper process
-        wrapper_script = Path(__file__).parent / "llm_api_wrapper.py"
-        cmd = [sys.executable, str(wrapper_script), "--provider", self.provider, "--model", self.model]
+        cmd = self._spawn_argv["api"]
         
+        # The wrapper's output is actually consumed - PIPE stays here
         return subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True
+            text=True,
+            close_fds=_CLOSE_FDS_FAST
         )
     
     def _spawn_mock_llm_process(self) -> subprocess.Popen:
         """Spawn mock LLM process for testing"""
-        cmd = [sys.executable, "-c", 
-               "import time; print('🤖 Mock LLM started'); time.sleep(3600)"]
+        cmd = self._spawn_argv["mock"]
         
+        # Mock output is pure noise - drop it
         return subprocess.Popen(
             cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=_CLOSE_FDS_FAST
         )
 
+class LLMPool:
+    """Pre-warmed pool of idle LLM processes
+
+    Cold-starting an LLM (fork+exec, model load) dominates turtle
+    initialization; claiming a warm process makes it near-instant, and
+    each acquire refills the pool in the background.
+    """
+
+    def __init__(self, interface: NativeLLMInterface, size: int = 2):
+        self.interface = interface
+        self.size = size
+        self._ready: queue.Queue = queue.Queue()
+        for _ in range(size):
+            self._ready.put(interface.spawn_llm_process())
+
+    def acquire(self) -> subprocess.Popen:
+        """Claim a warm process and kick off a background replacement"""
+        try:
+            process = self._ready.get_nowait()
+        except queue.Empty:
+            return self.interface.spawn_llm_process()
+        threading.Thread(target=self._refill, daemon=True).start()
+        return process
+
+    def _refill(self):
+        self._ready.put(self.interface.spawn_llm_process())
+
+    def shutdown(self):
+        """Terminate any still-idle pooled processes"""
+        while True:
+            try:
+                self._ready.get_nowait().terminate()
+            except queue.Empty:
+                break
+
+def _tune_tcp_socket(sock: socket.socket):
+    """Tune a TCP IPC socket for small JSON control frames
+
+    NODELAY flushes frames immediately instead of Nagle-batching them
+    (up to 40ms stalls); fixed 64KB buffers skip kernel auto-tuning and
+    QUICKACK suppresses the 200ms delayed ack on Linux.
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+    if hasattr(socket, 'TCP_QUICKACK'):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytearray]:
+    """Read exactly `size` bytes or None if the peer closed
+
+    recv_into fills one preallocated buffer - no per-chunk bytes objects
+    and no concatenation copies on large payloads.
+    """
+    buf = bytearray(size)
+    view = memoryview(buf)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:])
+        if n == 0:
+            return None
+        received += n
+    return buf
+
+def _send_frame(sock: socket.socket, payload: bytes):
+    """Write one length-prefixed frame (4-byte big-endian header)"""
+    sock.sendall(len(payload).to_bytes(4, 'big') + payload)
+
+def _recv_frame(sock: socket.socket) -> Optional[bytes]:
+    """Read one length-prefixed frame or None if the peer closed"""
+    header = _recv_exact(sock, 4)
+    if header is None:
+        return None
+    return _recv_exact(sock, int.from_bytes(header, 'big'))
+
 class NativeTurtleProcess:
     """Native turtle process - independent of Claude tooling"""
     
@@ -121,13 +286,21 @@ class NativeTurtleProcess:
         self.spec = spec
         self.pid = os.getpid()
         self.llm_interface = NativeLLMInterface(spec.llm_provider, spec.llm_model)
+        self.llm_pool = None
         self.llm_process = None
         self.child_processes: Dict[int, subprocess.Popen] = {}
         self.communication_server = None
+        # One persistent connection per target turtle - skips the
+        # connect/teardown round-trips on every message
+        self._conn_pool: Dict[Any, socket.socket] = {}
+        self._conn_lock = threading.Lock()
+        self._shutdown_requested = False
         
         # Set up signal handlers
         signal.signal(signal.SIGTERM, self._handle_shutdown)
         signal.signal(signal.SIGINT, self._handle_shutdown)
+        if hasattr(signal, 'SIGCHLD'):
+            signal.signal(signal.SIGCHLD, self._reap_children)
         
         print(f"🐢 Native turtle process started: {self.spec.turtle_id} (PID: {self.pid})")
     
@@ -135,9 +308,10 @@ class NativeTurtleProcess:
         """Initialize turtle process"""
         print(f"🔧 Initializing {self.spec.turtle_id} in {self.spec.mode.value} mode")
         
-        # Start LLM process if needed
+        # Start LLM process if needed - claimed from a pre-warmed pool
         if self.spec.mode in [TurtleMode.PRIME, TurtleMode.WORKER]:
-            self.llm_process = self.llm_interface.spawn_llm_process()
+            self.llm_pool = LLMPool(self.llm_interface)
+            self.llm_process = self.llm_pool.acquire()
             print(f"🤖 Started LLM process: {self.spec.llm_provider}/{self.spec.llm_model}")
         
         # Start communication server
@@ -152,45 +326,113 @@ class NativeTurtleProcess:
             self._initialize_llm_host()
     
     def _start_communication_server(self):
-        """Start inter-process communication server"""
-        self.spec.communication_port = self._find_free_port()
-        
-        def server_thread():
-            server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            server_socket.bind(('localhost', self.spec.communication_port))
-            server_socket.listen(5)
-            
-            print(f"📡 Communication server listening on port {self.spec.communication_port}")
-            
+        """Start inter-process communication server (UDS by default)
+
+        Runs several accept threads. For TCP each thread gets its own
+        SO_REUSEPORT listener so the kernel load-balances connections
+        across them; threads are pinned to CPUs and each listener is
+        tagged with SO_INCOMING_CPU so a connection's socket buffers
+        and its handler stay on the same cache.
+        """
+        if self.spec.use_tcp:
+            self.spec.communication_port = self._find_free_port()
+            endpoint = f"port {self.spec.communication_port}"
+        else:
+            self.spec.socket_path = self.spec.socket_path or f"/tmp/turtle-{self.spec.turtle_id}.sock"
+            endpoint = self.spec.socket_path
+
+        num_acceptors = min(4, os.cpu_count() or 1)
+        reuseport = self.spec.use_tcp and hasattr(socket, 'SO_REUSEPORT')
+        if not reuseport:
+            # UDS (or no SO_REUSEPORT): one listener shared by all
+            # accept threads - the kernel wakes exactly one per connect
+            shared_listener = self._make_listener()
+
+        def accept_loop(cpu_id: int, listener: socket.socket):
+            if hasattr(os, 'sched_setaffinity'):
+                try:
+                    os.sched_setaffinity(0, {cpu_id})
+                except OSError:
+                    pass
             while True:
                 try:
-                    client_socket, address = server_socket.accept()
-                    self._handle_communication(client_socket)
+                    client_socket, address = listener.accept()
+                    if self.spec.use_tcp:
+                        _tune_tcp_socket(client_socket)
+                    # Handlers hold their connection open for pooled
+                    # clients, so they must not run on the accept
+                    # thread - a captured acceptor would cap the fleet
+                    # at the accept-thread count
+                    threading.Thread(
+                        target=self._handle_communication,
+                        args=(client_socket,), daemon=True).start()
                 except Exception as e:
                     print(f"❌ Communication error: {e}")
                     break
-        
-        self.communication_server = threading.Thread(target=server_thread, daemon=True)
-        self.communication_server.start()
+
+        acceptors = []
+        for cpu_id in range(num_acceptors):
+            listener = self._make_listener() if reuseport else shared_listener
+            if reuseport and hasattr(socket, 'SO_INCOMING_CPU'):
+                # Steer connections arriving on cpu_id to this listener,
+                # keeping struct sock, buffers and the pinned handler
+                # thread on the same L1/L2 instead of bouncing cachelines
+                try:
+                    listener.setsockopt(socket.SOL_SOCKET, socket.SO_INCOMING_CPU, cpu_id)
+                except OSError:
+                    pass
+            thread = threading.Thread(target=accept_loop, args=(cpu_id, listener), daemon=True)
+            thread.start()
+            acceptors.append(thread)
+
+        self.communication_server = acceptors[0]
+        self._accept_threads = acceptors
+        print(f"📡 Communication server listening on {endpoint} ({num_acceptors} accept threads)")
+
+    def _make_listener(self) -> socket.socket:
+        """Create and bind one listener for the configured transport"""
+        if self.spec.use_tcp:
+            server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, 'SO_REUSEPORT'):
+                server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            server_socket.bind(('localhost', self.spec.communication_port))
+        else:
+            server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                os.unlink(self.spec.socket_path)  # stale socket from a dead turtle
+            except FileNotFoundError:
+                pass
+            server_socket.bind(self.spec.socket_path)
+        server_socket.listen(self.spec.listen_backlog)
+        return server_socket
     
     def _find_free_port(self) -> int:
         """Find free port for communication"""
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             s.bind(('', 0))
-            s.listen(1)
+            s.listen(socket.SOMAXCONN)
             port = s.getsockname()[1]
         return port
     
     def _handle_communication(self, client_socket):
-        """Handle inter-turtle communication"""
+        """Handle inter-turtle communication
+
+        The connection stays open: each iteration serves one length-
+        prefixed request/response, so pooled clients reuse the socket.
+        """
         try:
-            data = client_socket.recv(4096).decode('utf-8')
-            message = json.loads(data)
-            
-            response = self._process_turtle_message(message)
-            
-            client_socket.send(json.dumps(response).encode('utf-8'))
+            while True:
+                data = _recv_frame(client_socket)
+                if data is None:
+                    break
+                message = _json_loads(data)
+                if isinstance(message, dict) and "shm" in message:
+                    message = _json_loads(_consume_blob(message))
+
+                response = self._process_turtle_message(message)
+
+                _send_frame(client_socket, _json_dumps(response))
         except Exception as e:
             print(f"❌ Message handling error: {e}")
         finally:
@@ -273,12 +515,15 @@ class NativeTurtleProcess:
         ]
         
         try:
+            out, err = _daemon_log_files(child_spec.turtle_id)
+            # cwd= forces the fork path regardless of the other flags,
+            # so keep the safer close_fds=True here
             child_process = subprocess.Popen(
                 cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=child_spec.working_directory
+                stdout=out,
+                stderr=err,
+                cwd=child_spec.working_directory,
+                close_fds=True
             )
             
             self.child_processes[child_process.pid] = child_process
@@ -290,22 +535,49 @@ class NativeTurtleProcess:
             print(f"❌ Failed to spawn child turtle: {e}")
             return None
     
-    def send_message_to_turtle(self, target_port: int, message: Dict) -> Optional[Dict]:
-        """Send message to another turtle process"""
+    def send_message_to_turtle(self, target, message: Dict) -> Optional[Dict]:
+        """Send message to another turtle process
+
+        `target` is a UDS path (str) or, for the TCP fallback, a port (int).
+        Connections are pooled per target and reopened on broken pipes.
+        """
+        payload = _json_dumps(message)
+        if len(payload) > _SHM_THRESHOLD:
+            payload = _json_dumps(_publish_blob(payload))
         try:
-            client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            client_socket.connect(('localhost', target_port))
-            
-            client_socket.send(json.dumps(message).encode('utf-8'))
-            response_data = client_socket.recv(4096).decode('utf-8')
-            
-            client_socket.close()
-            
-            return json.loads(response_data)
-            
+            with self._conn_lock:
+                client_socket = self._get_pooled_connection(target)
+                try:
+                    _send_frame(client_socket, payload)
+                    response_data = _recv_frame(client_socket)
+                except (BrokenPipeError, ConnectionResetError):
+                    # Peer restarted - reconnect once and retry
+                    self._conn_pool.pop(target, None)
+                    client_socket = self._get_pooled_connection(target)
+                    _send_frame(client_socket, payload)
+                    response_data = _recv_frame(client_socket)
+
+            if response_data is None:
+                return None
+            return _json_loads(response_data)
+
         except Exception as e:
             print(f"❌ Failed to send message: {e}")
             return None
+
+    def _get_pooled_connection(self, target) -> socket.socket:
+        """Fetch a live pooled connection to target, opening if needed"""
+        client_socket = self._conn_pool.get(target)
+        if client_socket is None or client_socket.fileno() == -1:
+            if isinstance(target, int):
+                client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                client_socket.connect(('localhost', target))
+                _tune_tcp_socket(client_socket)
+            else:
+                client_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                client_socket.connect(target)
+            self._conn_pool[target] = client_socket
+        return client_socket
     
     def _initialize_prime_turtle(self):
         """Initialize prime turtle coordinator"""
@@ -345,13 +617,14 @@ class NativeTurtleProcess:
         registry_data = {
             "prime_turtle_id": self.spec.turtle_id,
             "pid": self.pid,
+            "socket_path": self.spec.socket_path,
             "communication_port": self.spec.communication_port,
             "started_at": time.time(),
             "working_directory": self.spec.working_directory
         }
         
-        with open(prime_registry, 'w') as f:
-            json.dump(registry_data, f, indent=2)
+        with open(prime_registry, 'wb') as f:
+            f.write(_json_dumps_pretty(registry_data))
     
     def _register_with_parent(self):
         """Register with parent turtle"""
@@ -359,19 +632,55 @@ class NativeTurtleProcess:
         print(f"📝 Registering with parent PID {self.spec.parent_pid}")
     
     def _run_prime_coordination_loop(self):
-        """Main coordination loop for prime turtle"""
+        """Main coordination loop for prime turtle
+
+        Event-driven via epoll: child deaths (pidfds) and signals (a
+        self-pipe wakeup fd) wake the loop immediately instead of being
+        noticed on the next fixed 5s poll; the select timeout only paces
+        periodic housekeeping.
+        """
         print(f"🔄 Starting prime coordination loop")
-        
+
+        sel = selectors.DefaultSelector()
+
+        # Signals write one byte here rather than interrupting arbitrary
+        # bytecode; the selector wakes and we handle them synchronously
+        wakeup_r, wakeup_w = os.pipe()
+        os.set_blocking(wakeup_w, False)
+        signal.set_wakeup_fd(wakeup_w)
+        sel.register(wakeup_r, selectors.EVENT_READ, "signal")
+
+        registered_pidfds: Dict[int, int] = {}
+
         while True:
             try:
-                # Monitor child processes
-                self._monitor_child_processes()
-                
-                # Handle any pending coordination tasks
+                # Watch children spawned since the last pass
+                if hasattr(os, 'pidfd_open'):
+                    for pid in self.child_processes.keys() - registered_pidfds.keys():
+                        try:
+                            pidfd = os.pidfd_open(pid)
+                        except OSError:
+                            continue  # already gone; housekeeping reaps it
+                        registered_pidfds[pid] = pidfd
+                        sel.register(pidfd, selectors.EVENT_READ, ("child", pid))
+
+                for key, _ in sel.select(timeout=5):
+                    if key.data == "signal":
+                        os.read(key.fd, 4096)
+                    else:
+                        _, pid = key.data
+                        sel.unregister(key.fd)
+                        os.close(key.fd)
+                        del registered_pidfds[pid]
+                        print(f"💀 Child process {pid} exited")
+
+                if self._shutdown_requested:
+                    self._graceful_shutdown()
+
+                # Periodic housekeeping / consistency check
                 # (This would integrate with LLM for decision making)
-                
-                time.sleep(5)  # Coordination interval
-                
+                self._monitor_child_processes()
+
             except KeyboardInterrupt:
                 print(f"🛑 Prime turtle shutting down")
                 break
@@ -383,7 +692,7 @@ class NativeTurtleProcess:
         """Main loop for worker turtle"""
         print(f"🔄 Starting worker loop")
         
-        while True:
+        while not self._shutdown_requested:
             try:
                 # Worker tasks would be handled through communication messages
                 time.sleep(1)
@@ -394,6 +703,7 @@ class NativeTurtleProcess:
             except Exception as e:
                 print(f"❌ Worker loop error: {e}")
                 time.sleep(1)
+        self._graceful_shutdown()
     
     def _run_llm_host_loop(self):
         """Main loop for LLM host"""
@@ -413,34 +723,75 @@ class NativeTurtleProcess:
             except Exception as e:
                 print(f"❌ LLM host loop error: {e}")
                 time.sleep(10)
+            if self._shutdown_requested:
+                self._graceful_shutdown()
     
+    def _reap_children(self, signum=None, frame=None):
+        """SIGCHLD handler - drain every exited child in one pass
+
+        os.waitid(P_ALL, WNOHANG) reaps all pending exits with a single
+        syscall per invocation, instead of one poll()/waitpid per child
+        every monitoring interval.
+        """
+        while True:
+            try:
+                info = os.waitid(os.P_ALL, 0, os.WNOHANG | os.WEXITED)
+            except (ChildProcessError, InterruptedError):
+                return
+            if info is None:
+                return
+            if self.child_processes.pop(info.si_pid, None) is not None:
+                print(f"💀 Child process {info.si_pid} has died")
+
     def _monitor_child_processes(self):
-        """Monitor health of child processes"""
+        """Slow-path consistency check behind the SIGCHLD reaper"""
         dead_children = []
-        
-        for pid, process in self.child_processes.items():
+
+        # Snapshot first: the SIGCHLD reaper runs between bytecodes on
+        # this same thread and pops entries, which would blow up a live
+        # dict iteration mid-pass
+        for pid, process in list(self.child_processes.items()):
             if process.poll() is not None:
                 dead_children.append(pid)
                 print(f"💀 Child process {pid} has died")
-        
-        # Clean up dead children
+
+        # Clean up dead children (the reaper may have beaten us to one)
         for pid in dead_children:
-            del self.child_processes[pid]
+            self.child_processes.pop(pid, None)
     
     def _handle_shutdown(self, signum, frame):
-        """Handle shutdown signals"""
+        """Handle shutdown signals
+
+        Only sets a flag: calling sys.exit (or touching locks) inside a
+        signal handler can deadlock if the signal lands on a thread
+        holding the import or socket lock. The main loops observe the
+        flag - the prime loop is also woken via its wakeup fd - and run
+        the orderly shutdown themselves.
+        """
         print(f"🛑 Received shutdown signal {signum}")
-        
-        # Shutdown child processes
-        for pid, process in self.child_processes.items():
+        self._shutdown_requested = True
+
+    def _graceful_shutdown(self):
+        """Orderly shutdown from the main loop: SIGTERM children, wait
+        up to 5s, SIGKILL stragglers, then exit"""
+        for pid, process in list(self.child_processes.items()):
             print(f"🛑 Shutting down child {pid}")
             process.terminate()
-            
-        # Shutdown LLM process
+
+        deadline = time.time() + 5
+        for pid, process in list(self.child_processes.items()):
+            try:
+                process.wait(timeout=max(0.0, deadline - time.time()))
+            except subprocess.TimeoutExpired:
+                print(f"🛑 Killing unresponsive child {pid}")
+                process.kill()
+
+        if self.llm_pool:
+            self.llm_pool.shutdown()
         if self.llm_process:
             print(f"🛑 Shutting down LLM process")
             self.llm_process.terminate()
-        
+
         sys.exit(0)
 
 def main():
@@ -460,6 +811,8 @@ def main():
     parser.add_argument("--parent-pid", type=int, help="Parent process PID")
     parser.add_argument("--working-directory", type=str, default=os.getcwd(), 
                        help="Working directory")
+    parser.add_argument("--listen-backlog", type=int, default=socket.SOMAXCONN,
+                       help="Communication server listen() backlog")
     
     # Special commands
     parser.add_argument("--spawn", nargs=4, metavar=("ID", "SPEC", "PROVIDER", "MODEL"),
@@ -496,7 +849,8 @@ def main():
         llm_provider=args.llm_provider,
         llm_model=args.llm_model,
         parent_pid=args.parent_pid,
-        working_directory=args.working_directory
+        working_directory=args.working_directory,
+        listen_backlog=args.listen_backlog
     )
     
     turtle = NativeTurtleProcess(spec)
@@ -5,18 +5,51 @@ Break free from single-threaded Claude limitations NOW
 """
 
 import asyncio
+import fnmatch
+import glob
+import mmap
+import os
+import re
 import subprocess
 import json
 import time
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from functools import cached_property
 from typing import List, Dict, Any, Callable
 import multiprocessing as mp
 
+# Compiled once - section markers counted in a single C-level sweep
+# (bytes pattern: it runs directly over the mmap'd buffer)
+_AT_SECTION_RE = re.compile(rb'(?m)^\s*@\S+')
+
+def _count_occurrences(buf, needle: bytes) -> int:
+    """Count needle occurrences via C-level find (mmap has no .count)"""
+    count = 0
+    pos = buf.find(needle)
+    while pos != -1:
+        count += 1
+        pos = buf.find(needle, pos + len(needle))
+    return count
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None  # reads fall back to the thread pool
+
 class TurtleParallelBreakthrough:
     def __init__(self, max_workers: int = None):
-        self.max_workers = max_workers or min(32, (mp.cpu_count() or 1) + 4)
+        cpu_count = mp.cpu_count() or 1
+        # The thread pool serves pure I/O (file syscalls, provider
+        # networking) - size it well past the CPU-bound heuristic
+        self.max_workers = max_workers or min(256, cpu_count * 8)
         self.thread_executor = ThreadPoolExecutor(max_workers=self.max_workers)
-        self.process_executor = ProcessPoolExecutor(max_workers=4)
+        # CPU-bound branches (CNL parsing) get their own right-sized pool
+        self.cpu_executor = ThreadPoolExecutor(max_workers=cpu_count)
+
+    @cached_property
+    def process_executor(self) -> ProcessPoolExecutor:
+        """Forked interpreters cost real startup - only pay on first use"""
+        return ProcessPoolExecutor(max_workers=4)
         
     def batch_file_operations(self, operations: List[Dict[str, Any]]) -> List[Any]:
         """Execute multiple file operations in parallel - IMMEDIATE WIN"""
@@ -38,8 +71,18 @@ class TurtleParallelBreakthrough:
                     result = subprocess.run(op['command'], shell=True, capture_output=True, text=True)
                     result = {'stdout': result.stdout, 'stderr': result.stderr, 'returncode': result.returncode}
                 elif op_type == 'glob':
-                    import glob
-                    result = glob.glob(op['pattern'])
+                    dir_name, _, name_pattern = op['pattern'].rpartition('/')
+                    if any(c in dir_name for c in '*?['):
+                        # Wildcards in the directory part (sub/**/x.py,
+                        # */inner/a.py) need glob's full tree walk
+                        result = sorted(glob.glob(op['pattern'], recursive=True))
+                    else:
+                        # Flat pattern: scandir avoids the per-entry
+                        # stat() calls glob pays
+                        result = sorted(
+                            entry.path for entry in os.scandir(dir_name or '.')
+                            if fnmatch.fnmatch(entry.name, name_pattern)
+                        )
                 else:
                     result = f"Unknown operation: {op_type}"
                 
@@ -50,10 +93,46 @@ class TurtleParallelBreakthrough:
                 execution_time = time.time() - start_time
                 return {'success': False, 'error': str(e), 'time': execution_time, 'operation': op}
         
-        # Execute all operations in parallel
+        async def read_operation(op):
+            start = time.time()
+            try:
+                async with aiofiles.open(op['path'], 'r') as f:
+                    content = await f.read()
+                return {'success': True, 'result': content, 'time': time.time() - start, 'operation': op}
+            except Exception as e:
+                return {'success': False, 'error': str(e), 'time': time.time() - start, 'operation': op}
+
+        # Execute all operations in parallel: reads ride the event loop
+        # (no thread per blocked syscall), everything else uses threads
         start_time = time.time()
-        futures = [self.thread_executor.submit(execute_operation, op) for op in operations]
-        results = [future.result() for future in futures]
+        results: List[Any] = [None] * len(operations)
+
+        read_indexed = []
+        thread_futures = {}
+        for i, op in enumerate(operations):
+            if op['type'] == 'read' and aiofiles is not None:
+                read_indexed.append((i, op))
+            else:
+                thread_futures[self.thread_executor.submit(execute_operation, op)] = i
+
+        if read_indexed:
+            # asyncio.run only accepts a coroutine, not the future
+            # gather returns - so gather inside one
+            async def _run_reads():
+                return await asyncio.gather(
+                    *(read_operation(op) for _, op in read_indexed))
+
+            read_results = asyncio.run(_run_reads())
+            for (i, _), read_result in zip(read_indexed, read_results):
+                results[i] = read_result
+
+        # Collect in completion order - a slow op can't block handling
+        # of faster ones that already finished
+        pending = set(thread_futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[thread_futures[future]] = future.result()
         total_time = time.time() - start_time
         
         print(f"⚡ BREAKTHROUGH: {len(operations)} ops in {total_time:.2f}s (vs {sum(r['time'] for r in results):.2f}s sequential)")
@@ -61,7 +140,8 @@ class TurtleParallelBreakthrough:
         
         return results
     
-    def multi_provider_racing(self, prompt: str, providers: List[str]) -> Dict[str, Any]:
+    def multi_provider_racing(self, prompt: str, providers: List[str],
+                              overall_timeout: float = None) -> Dict[str, Any]:
         """Send same request to multiple providers, use fastest response"""
         print(f"🏁 PROVIDER RACING: {len(providers)} providers competing for fastest response")
         
@@ -93,26 +173,22 @@ class TurtleParallelBreakthrough:
                 'timestamp': time.time()
             }
         
-        # Race all providers
+        # Race all providers: take the first finisher, cancel the rest.
+        # The race now costs O(fastest) instead of waiting on every loser.
         start_time = time.time()
         futures = [self.thread_executor.submit(call_provider, provider) for provider in providers]
-        
-        # Return first completed result
+
+        fastest_result = next(as_completed(futures, timeout=overall_timeout)).result()
+
+        # Losers that haven't started are dropped; already-running calls
+        # finish in the background without blocking us
         for future in futures:
-            if future.done() or True:  # In real implementation, use as_completed
-                try:
-                    result = future.result(timeout=0.1)  # Very short timeout for demo
-                except:
-                    continue
-        
-        # For demo, just get all results and return fastest
-        all_results = [future.result() for future in futures]
-        fastest_result = min(all_results, key=lambda x: x['time'])
+            future.cancel()
         total_time = time.time() - start_time
-        
+
         print(f"🏆 WINNER: {fastest_result['provider']} in {fastest_result['time']:.2f}s")
-        print(f"⚡ vs slowest: {max(r['time'] for r in all_results):.2f}s")
-        
+        print(f"⚡ Race decided in {total_time:.2f}s, losers cancelled")
+
         return fastest_result
     
     def parallel_cnl_processing(self, cnl_files: List[str]) -> Dict[str, Any]:
@@ -122,23 +198,32 @@ class TurtleParallelBreakthrough:
         def process_cnl_module(file_path):
             start_time = time.time()
             try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                
-                # Simulate CNL parsing and analysis
-                lines = content.split('\n')
-                triggers = [line for line in lines if 'triggers:' in line]
-                dependencies = [line for line in lines if 'dependencies:' in line]
-                sections = [line for line in lines if line.strip().startswith('@')]
+                # mmap gives zero-copy access straight into the page
+                # cache - no full-file str allocation or UTF-8 decode
+                with open(file_path, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    if size == 0:
+                        triggers = dependencies = sections = line_count = 0
+                    else:
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                        try:
+                            # CNL parsing and analysis: C-implemented
+                            # count/findall sweep the buffer once each
+                            triggers = _count_occurrences(mm, b'triggers:')
+                            dependencies = _count_occurrences(mm, b'dependencies:')
+                            sections = len(_AT_SECTION_RE.findall(mm))
+                            line_count = _count_occurrences(mm, b'\n') + 1
+                        finally:
+                            mm.close()
                 
                 processing_time = time.time() - start_time
                 
                 return {
                     'file': file_path,
-                    'lines': len(lines),
-                    'triggers': len(triggers),
-                    'dependencies': len(dependencies),
-                    'sections': len(sections),
+                    'lines': line_count,
+                    'triggers': triggers,
+                    'dependencies': dependencies,
+                    'sections': sections,
                     'processing_time': processing_time,
                     'success': True
                 }
@@ -151,10 +236,16 @@ class TurtleParallelBreakthrough:
                     'success': False
                 }
         
-        # Process all CNL files in parallel
+        # Process all CNL files in parallel, collecting in completion order
         start_time = time.time()
-        futures = [self.thread_executor.submit(process_cnl_module, file_path) for file_path in cnl_files]
-        results = [future.result() for future in futures]
+        futures = {self.cpu_executor.submit(process_cnl_module, file_path): i
+                   for i, file_path in enumerate(cnl_files)}
+        results: List[Any] = [None] * len(cnl_files)
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures[future]] = future.result()
         total_time = time.time() - start_time
         
         successful_results = [r for r in results if r['success']]
@@ -194,7 +285,6 @@ class TurtleParallelBreakthrough:
         
         # 3. Parallel CNL processing
         print("\n3️⃣ PARALLEL CNL PROCESSING")
-        import glob
         cnl_files = glob.glob('kernel/modules/*.cnl')
         cnl_results = self.parallel_cnl_processing(cnl_files)
         
@@ -206,9 +296,12 @@ class TurtleParallelBreakthrough:
         }
     
     def cleanup(self):
-        """Clean up thread pools"""
+        """Clean up executors - a never-used process pool is skipped
+        so we don't fork four interpreters just to shut them down"""
         self.thread_executor.shutdown(wait=True)
-        self.process_executor.shutdown(wait=True)
+        self.cpu_executor.shutdown(wait=True)
+        if 'process_executor' in self.__dict__:
+            self.process_executor.shutdown(wait=True)
 
 def main():
     """Demonstrate immediate parallel execution breakthrough"""
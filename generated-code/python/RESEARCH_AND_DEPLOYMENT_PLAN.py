@@ -5,9 +5,13 @@ Simultaneous academic publication and production implementation
 Theory validates practice, practice validates theory
 """
 
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import heapq
+import itertools
+import operator
+
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 
 class DeliveryTrack(Enum):
@@ -15,244 +19,266 @@ class DeliveryTrack(Enum):
     DEPLOYMENT = "deployment"       # Production implementation
     VALIDATION = "validation"       # Cross-validation between tracks
 
-@dataclass
-class ResearchDeliverable:
+class ResearchDeliverable(NamedTuple):
     """Research track deliverable"""
     title: str
     type: str  # paper, whitepaper, specification, standard
     target_venue: str
     timeline: timedelta
-    dependencies: List[str]
+    dependencies: Tuple[str, ...]
     validation_from_deployment: str
+    due_date: Optional[datetime] = None
 
-@dataclass
-class DeploymentDeliverable:
+class DeploymentDeliverable(NamedTuple):
     """Deployment track deliverable"""
     component: str
     functionality: str
     production_readiness: str
     timeline: timedelta
-    dependencies: List[str]
+    dependencies: Tuple[str, ...]
     research_contribution: str
+    due_date: Optional[datetime] = None
 
-class DualTrackPlan:
-    """Coordinated research and deployment execution plan"""
+# None of the plan data depends on runtime input, so the deliverables
+# are built exactly once at import time; every DualTrackPlan() shares
+# the same immutable instances instead of re-allocating them per plan.
+# NamedTuple stores fields in a C-level tuple - no per-instance dict,
+# and attribute access is a tuple index rather than a dict lookup.
+_RESEARCH_TRACK = (
+    ResearchDeliverable(
+        title="Category Theory for Distributed Systems: Mathematical Foundations",
+        type="academic_paper",
+        target_venue="ACM PODC / IEEE ICDCS / USENIX ATC",
+        timeline=timedelta(days=120),
+        dependencies=(),
+        validation_from_deployment="Turtle microkernel implementation validates categorical morphisms"
+    ),
     
-    def __init__(self):
-        self.research_track = self._define_research_track()
-        self.deployment_track = self._define_deployment_track()
-        self.cross_validations = self._define_cross_validations()
-        
-    def _define_research_track(self) -> List[ResearchDeliverable]:
-        """Define research publication track"""
-        return [
-            ResearchDeliverable(
-                title="Category Theory for Distributed Systems: Mathematical Foundations",
-                type="academic_paper",
-                target_venue="ACM PODC / IEEE ICDCS / USENIX ATC",
-                timeline=timedelta(days=120),
-                dependencies=[],
-                validation_from_deployment="Turtle microkernel implementation validates categorical morphisms"
-            ),
-            
-            ResearchDeliverable(
-                title="Hierarchical Turtle Architecture Specification v1.0",
-                type="technical_specification",
-                target_venue="IETF RFC / W3C Standard / IEEE Standard",
-                timeline=timedelta(days=90),
-                dependencies=["Category Theory paper"],
-                validation_from_deployment="Multi-scale production deployment validates hierarchical model"
-            ),
-            
-            ResearchDeliverable(
-                title="Multi-Domain Communication via Categorical Semantics",
-                type="business_whitepaper", 
-                target_venue="Harvard Business Review / MIT Sloan / McKinsey Insights",
-                timeline=timedelta(days=60),
-                dependencies=["Technical specification"],
-                validation_from_deployment="Business process optimization results validate translation framework"
-            ),
-            
-            ResearchDeliverable(
-                title="CAP-Aware Distributed Coordination: Theory and Practice",
-                type="systems_paper",
-                target_venue="OSDI / SOSP / NSDI",
-                timeline=timedelta(days=150),
-                dependencies=["Category Theory paper"],
-                validation_from_deployment="Production fault tolerance data validates CAP theorem adaptations"
-            ),
-            
-            ResearchDeliverable(
-                title="LLM-Native Distributed Computing: The Turtle Paradigm",
-                type="ai_conference_paper",
-                target_venue="NeurIPS / ICML / ICLR",
-                timeline=timedelta(days=180),
-                dependencies=["Technical specification"],
-                validation_from_deployment="Multi-LLM fleet performance validates provider specialization theory"
-            )
-        ]
+    ResearchDeliverable(
+        title="Hierarchical Turtle Architecture Specification v1.0",
+        type="technical_specification",
+        target_venue="IETF RFC / W3C Standard / IEEE Standard",
+        timeline=timedelta(days=90),
+        dependencies=("Category Theory paper",),
+        validation_from_deployment="Multi-scale production deployment validates hierarchical model"
+    ),
     
-    def _define_deployment_track(self) -> List[DeploymentDeliverable]:
-        """Define production deployment track"""
-        return [
-            DeploymentDeliverable(
-                component="Turtle Microkernel Core",
-                functionality="Basic spawning, coordination, CAP-aware fault tolerance",
-                production_readiness="Alpha (internal use)",
-                timeline=timedelta(days=30),
-                dependencies=[],
-                research_contribution="Validates category theory morphism composition in practice"
-            ),
-            
-            DeploymentDeliverable(
-                component="Multi-LLM Provider Abstraction",
-                functionality="Claude, OpenAI, Bedrock, Local LLM coordination",
-                production_readiness="Beta (limited external use)",
-                timeline=timedelta(days=45),
-                dependencies=["Turtle Microkernel Core"],
-                research_contribution="Provides empirical data on LLM specialization effectiveness"
-            ),
-            
-            DeploymentDeliverable(
-                component="Hierarchical Fleet Management",
-                functionality="Thread→Process→Container→VM→Machine→DC→Zone coordination",
-                production_readiness="Production (full scale)",
-                timeline=timedelta(days=75),
-                dependencies=["Multi-LLM Provider"],
-                research_contribution="Validates hierarchical scaling theory with real performance metrics"
-            ),
-            
-            DeploymentDeliverable(
-                component="Business Process Integration",
-                functionality="Organizational workflow automation via turtle delegation",
-                production_readiness="Production (customer-facing)",
-                timeline=timedelta(days=90),
-                dependencies=["Hierarchical Fleet Management"],
-                research_contribution="Proves multi-domain translation effectiveness in business context"
-            ),
-            
-            DeploymentDeliverable(
-                component="Real-time Observability Dashboard",
-                functionality="Live turtle fleet monitoring, performance analytics, cost optimization",
-                production_readiness="Production (enterprise)",
-                timeline=timedelta(days=60),
-                dependencies=["Business Process Integration"],
-                research_contribution="Provides quantitative validation data for all research claims"
-            )
-        ]
+    ResearchDeliverable(
+        title="Multi-Domain Communication via Categorical Semantics",
+        type="business_whitepaper", 
+        target_venue="Harvard Business Review / MIT Sloan / McKinsey Insights",
+        timeline=timedelta(days=60),
+        dependencies=("Technical specification",),
+        validation_from_deployment="Business process optimization results validate translation framework"
+    ),
     
-    def _define_cross_validations(self) -> Dict[str, Dict[str, str]]:
-        """Define how research and deployment validate each other"""
-        return {
-            "category_theory_validation": {
-                "research_claim": "Categorical morphisms guarantee compositional correctness",
-                "deployment_proof": "Zero composition failures in production turtle spawning",
-                "metric": "Composition success rate: 99.99%+"
-            },
-            
-            "hierarchical_scaling_validation": {
-                "research_claim": "Hierarchical coordination scales logarithmically with fleet size",
-                "deployment_proof": "Coordination latency remains <100ms for fleets up to 10,000 turtles",
-                "metric": "O(log n) scaling confirmed empirically"
-            },
-            
-            "cap_theorem_validation": {
-                "research_claim": "Explicit CAP strategy selection optimizes distributed performance",
-                "deployment_proof": "AP mode maintains 99.9% availability, CP mode ensures consistency",
-                "metric": "Strategy-appropriate performance in partition scenarios"
-            },
-            
-            "multi_domain_translation_validation": {
-                "research_claim": "Category theory enables precise cross-domain communication",
-                "deployment_proof": "Business stakeholders achieve >90% technical comprehension",
-                "metric": "Stakeholder comprehension scores and decision speed"
-            },
-            
-            "llm_specialization_validation": {
-                "research_claim": "Provider-specialization matching improves task performance",
-                "deployment_proof": "Optimal LLM selection improves task completion by 30%+",
-                "metric": "Performance improvement over random LLM assignment"
-            }
-        }
+    ResearchDeliverable(
+        title="CAP-Aware Distributed Coordination: Theory and Practice",
+        type="systems_paper",
+        target_venue="OSDI / SOSP / NSDI",
+        timeline=timedelta(days=150),
+        dependencies=("Category Theory paper",),
+        validation_from_deployment="Production fault tolerance data validates CAP theorem adaptations"
+    ),
     
-    def generate_publication_roadmap(self) -> Dict[str, Any]:
-        """Generate coordinated publication and deployment roadmap"""
-        roadmap = {
-            "timeline_months": 12,
-            "parallel_execution": True,
-            "milestone_schedule": [],
-            "resource_requirements": {},
-            "success_metrics": {},
-            "risk_mitigation": {}
-        }
+    ResearchDeliverable(
+        title="LLM-Native Distributed Computing: The Turtle Paradigm",
+        type="ai_conference_paper",
+        target_venue="NeurIPS / ICML / ICLR",
+        timeline=timedelta(days=180),
+        dependencies=("Technical specification",),
+        validation_from_deployment="Multi-LLM fleet performance validates provider specialization theory"
+    )
+)
+
+_DEPLOYMENT_TRACK = (
+    DeploymentDeliverable(
+        component="Turtle Microkernel Core",
+        functionality="Basic spawning, coordination, CAP-aware fault tolerance",
+        production_readiness="Alpha (internal use)",
+        timeline=timedelta(days=30),
+        dependencies=(),
+        research_contribution="Validates category theory morphism composition in practice"
+    ),
+    
+    DeploymentDeliverable(
+        component="Multi-LLM Provider Abstraction",
+        functionality="Claude, OpenAI, Bedrock, Local LLM coordination",
+        production_readiness="Beta (limited external use)",
+        timeline=timedelta(days=45),
+        dependencies=("Turtle Microkernel Core",),
+        research_contribution="Provides empirical data on LLM specialization effectiveness"
+    ),
+    
+    DeploymentDeliverable(
+        component="Hierarchical Fleet Management",
+        functionality="Thread→Process→Container→VM→Machine→DC→Zone coordination",
+        production_readiness="Production (full scale)",
+        timeline=timedelta(days=75),
+        dependencies=("Multi-LLM Provider",),
+        research_contribution="Validates hierarchical scaling theory with real performance metrics"
+    ),
+    
+    DeploymentDeliverable(
+        component="Business Process Integration",
+        functionality="Organizational workflow automation via turtle delegation",
+        production_readiness="Production (customer-facing)",
+        timeline=timedelta(days=90),
+        dependencies=("Hierarchical Fleet Management",),
+        research_contribution="Proves multi-domain translation effectiveness in business context"
+    ),
+    
+    DeploymentDeliverable(
+        component="Real-time Observability Dashboard",
+        functionality="Live turtle fleet monitoring, performance analytics, cost optimization",
+        production_readiness="Production (enterprise)",
+        timeline=timedelta(days=60),
+        dependencies=("Business Process Integration",),
+        research_contribution="Provides quantitative validation data for all research claims"
+    )
+)
+
+# Consumed in due-date order: sorting each track once at import lets
+# the roadmap merge two already-sorted streams instead of re-sorting
+# the combined list on every call
+_RESEARCH_TRACK = tuple(sorted(_RESEARCH_TRACK, key=operator.attrgetter("timeline")))
+_DEPLOYMENT_TRACK = tuple(sorted(_DEPLOYMENT_TRACK, key=operator.attrgetter("timeline")))
+
+# Absolute due-dates are fixed per process: stamping them here means
+# roadmap generation reads a stored field instead of paying a
+# datetime.now() syscall plus a timedelta add per milestone per call
+_BASE = datetime.now(timezone.utc)
+_RESEARCH_TRACK = tuple(d._replace(due_date=_BASE + d.timeline) for d in _RESEARCH_TRACK)
+_DEPLOYMENT_TRACK = tuple(d._replace(due_date=_BASE + d.timeline) for d in _DEPLOYMENT_TRACK)
+
+_CROSS_VALIDATIONS = MappingProxyType({
+    "category_theory_validation": {
+        "research_claim": "Categorical morphisms guarantee compositional correctness",
+        "deployment_proof": "Zero composition failures in production turtle spawning",
+        "metric": "Composition success rate: 99.99%+"
+    },
+    
+    "hierarchical_scaling_validation": {
+        "research_claim": "Hierarchical coordination scales logarithmically with fleet size",
+        "deployment_proof": "Coordination latency remains <100ms for fleets up to 10,000 turtles",
+        "metric": "O(log n) scaling confirmed empirically"
+    },
+    
+    "cap_theorem_validation": {
+        "research_claim": "Explicit CAP strategy selection optimizes distributed performance",
+        "deployment_proof": "AP mode maintains 99.9% availability, CP mode ensures consistency",
+        "metric": "Strategy-appropriate performance in partition scenarios"
+    },
+    
+    "multi_domain_translation_validation": {
+        "research_claim": "Category theory enables precise cross-domain communication",
+        "deployment_proof": "Business stakeholders achieve >90% technical comprehension",
+        "metric": "Stakeholder comprehension scores and decision speed"
+    },
+    
+    "llm_specialization_validation": {
+        "research_claim": "Provider-specialization matching improves task performance",
+        "deployment_proof": "Optimal LLM selection improves task completion by 30%+",
+        "metric": "Performance improvement over random LLM assignment"
+    }
+})
+
+class FundingItem(NamedTuple):
+    """Funding source with its amount held as a number, not a string"""
+    usd: int
+    label: str
+
+class DualTrackPlan:
+    """Coordinated research and deployment execution plan"""
+    
+    def __init__(self):
+        self.research_track = _RESEARCH_TRACK
+        self.deployment_track = _DEPLOYMENT_TRACK
+        self.cross_validations = _CROSS_VALIDATIONS
         
-        # Create integrated timeline
-        current_date = datetime.now()
-        for deliverable in self.research_track:
-            milestone = {
+    def generate_publication_roadmap(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """Generate coordinated publication and deployment roadmap
+
+        With a limit, only the first `limit` milestones are kept - a
+        bounded heap over the lazy streams, O(n log k), instead of
+        materializing and ordering the full schedule.
+        """
+        # Create integrated timeline: each track is already timeline-
+        # sorted, so heapq.merge interleaves the two streams in one O(n)
+        # pass - no combined-list re-sort, and itemgetter compares in C
+        research_milestones = (
+            {
                 "type": "research",
                 "title": deliverable.title,
-                "due_date": current_date + deliverable.timeline,
+                "due_date": deliverable.due_date,
                 "dependencies": deliverable.dependencies,
                 "validation_source": deliverable.validation_from_deployment
             }
-            roadmap["milestone_schedule"].append(milestone)
-        
-        for deliverable in self.deployment_track:
-            milestone = {
-                "type": "deployment", 
+            for deliverable in self.research_track
+        )
+        deployment_milestones = (
+            {
+                "type": "deployment",
                 "component": deliverable.component,
-                "due_date": current_date + deliverable.timeline,
+                "due_date": deliverable.due_date,
                 "dependencies": deliverable.dependencies,
                 "research_contribution": deliverable.research_contribution
             }
-            roadmap["milestone_schedule"].append(milestone)
-        
-        # Sort by due date
-        roadmap["milestone_schedule"].sort(key=lambda x: x["due_date"])
-        
-        # Define resource requirements
-        roadmap["resource_requirements"] = {
-            "research_track": {
-                "senior_researcher": "1.0 FTE",
-                "research_assistant": "0.5 FTE", 
-                "technical_writer": "0.3 FTE",
-                "publication_budget": "$15K"
+            for deliverable in self.deployment_track
+        )
+        if limit is None:
+            milestone_schedule = list(heapq.merge(
+                research_milestones, deployment_milestones,
+                key=operator.itemgetter("due_date")))
+        else:
+            milestone_schedule = heapq.nsmallest(
+                limit,
+                itertools.chain(research_milestones, deployment_milestones),
+                key=operator.itemgetter("due_date"))
+
+        return {
+            "timeline_months": 12,
+            "parallel_execution": True,
+            "milestone_schedule": milestone_schedule,
+            "resource_requirements": {
+                "research_track": {
+                    "senior_researcher": "1.0 FTE",
+                    "research_assistant": "0.5 FTE", 
+                    "technical_writer": "0.3 FTE",
+                    "publication_budget": "$15K"
+                },
+                "deployment_track": {
+                    "senior_engineer": "2.0 FTE",
+                    "devops_engineer": "1.0 FTE",
+                    "infrastructure_budget": "$25K/month",
+                    "testing_environment": "$10K setup"
+                },
+                "cross_validation": {
+                    "data_scientist": "0.5 FTE",
+                    "validation_infrastructure": "$5K/month"
+                }
             },
-            "deployment_track": {
-                "senior_engineer": "2.0 FTE",
-                "devops_engineer": "1.0 FTE",
-                "infrastructure_budget": "$25K/month",
-                "testing_environment": "$10K setup"
+            "success_metrics": {
+                "research_success": [
+                    "2+ tier-1 conference acceptances",
+                    "1 technical standard proposal",
+                    "1 business publication",
+                    "500+ citations within 2 years"
+                ],
+                "deployment_success": [
+                    "Production deployment handling >1M requests/day",
+                    "99.9%+ uptime with turtle coordination",
+                    "30%+ performance improvement over baseline",
+                    "5+ enterprise customer adoptions"
+                ],
+                "validation_success": [
+                    "All theoretical claims validated empirically",
+                    "Business stakeholder comprehension >90%",
+                    "Cross-domain adoption by 3+ industries"
+                ]
             },
-            "cross_validation": {
-                "data_scientist": "0.5 FTE",
-                "validation_infrastructure": "$5K/month"
-            }
-        }
-        
-        # Success metrics
-        roadmap["success_metrics"] = {
-            "research_success": [
-                "2+ tier-1 conference acceptances",
-                "1 technical standard proposal",
-                "1 business publication",
-                "500+ citations within 2 years"
-            ],
-            "deployment_success": [
-                "Production deployment handling >1M requests/day",
-                "99.9%+ uptime with turtle coordination",
-                "30%+ performance improvement over baseline",
-                "5+ enterprise customer adoptions"
-            ],
-            "validation_success": [
-                "All theoretical claims validated empirically",
-                "Business stakeholder comprehension >90%",
-                "Cross-domain adoption by 3+ industries"
-            ]
+            "risk_mitigation": {}
         }
-        
-        return roadmap
     
     def identify_synergies(self) -> List[Dict[str, str]]:
         """Identify synergistic opportunities between tracks"""
@@ -296,27 +322,31 @@ class DualTrackPlan:
         return synergies
     
     def generate_funding_strategy(self) -> Dict[str, Any]:
-        """Generate funding strategy for dual-track execution"""
+        """Generate funding strategy for dual-track execution
+
+        Amounts stay numeric until display time - totals are plain
+        integer sums instead of re-parsing currency strings.
+        """
         return {
-            "research_funding": {
-                "nsf_grants": "$250K - Distributed Systems Research",
-                "darpa_grants": "$500K - AI-Native Computing",
-                "corporate_research_partnerships": "$150K - Industry collaboration",
-                "university_partnerships": "$100K - Academic validation"
-            },
+            "research_funding": [
+                FundingItem(250_000, "NSF - Distributed Systems Research"),
+                FundingItem(500_000, "DARPA - AI-Native Computing"),
+                FundingItem(150_000, "Corporate research partnerships - Industry collaboration"),
+                FundingItem(100_000, "University partnerships - Academic validation")
+            ],
             
-            "deployment_funding": {
-                "venture_capital": "$2M - Series A for production deployment",
-                "government_contracts": "$500K - Enterprise pilot programs",
-                "customer_contracts": "$300K - Early customer implementations",
-                "cloud_credits": "$100K - Infrastructure partnerships"
-            },
+            "deployment_funding": [
+                FundingItem(2_000_000, "Venture capital - Series A for production deployment"),
+                FundingItem(500_000, "Government contracts - Enterprise pilot programs"),
+                FundingItem(300_000, "Customer contracts - Early customer implementations"),
+                FundingItem(100_000, "Cloud credits - Infrastructure partnerships")
+            ],
             
-            "dual_benefit_funding": {
-                "sbir_grants": "$500K - Small Business Innovation Research",
-                "innovation_prizes": "$100K - Industry competition awards",
-                "accelerator_programs": "$250K - Research-to-market programs"
-            },
+            "dual_benefit_funding": [
+                FundingItem(500_000, "SBIR - Small Business Innovation Research"),
+                FundingItem(100_000, "Innovation prizes - Industry competition awards"),
+                FundingItem(250_000, "Accelerator programs - Research-to-market programs")
+            ],
             
             "total_funding_target": "$4.75M over 18 months"
         }
@@ -329,9 +359,9 @@ def main():
     plan = DualTrackPlan()
     
     # Show publication roadmap
-    roadmap = plan.generate_publication_roadmap()
+    roadmap = plan.generate_publication_roadmap(limit=8)
     print(f"\n📅 COORDINATED TIMELINE ({roadmap['timeline_months']} months):")
-    for milestone in roadmap["milestone_schedule"][:8]:  # Show first 8 milestones
+    for milestone in roadmap["milestone_schedule"]:
         milestone_type = milestone["type"].upper()
         due_date = milestone["due_date"].strftime("%Y-%m-%d")
         if milestone_type == "RESEARCH":
@@ -355,9 +385,11 @@ def main():
     
     # Show funding strategy
     funding = plan.generate_funding_strategy()
+    research_total = sum(f.usd for f in funding['research_funding'])
+    deployment_total = sum(f.usd for f in funding['deployment_funding'])
     print(f"\n💰 FUNDING STRATEGY:")
-    print(f"   Research Track: ${sum(int(v.split('$')[1].split('K')[0]) if 'K' in v else int(v.split('$')[1].split('M')[0])*1000 for v in funding['research_funding'].values())}K")
-    print(f"   Deployment Track: ${funding['deployment_funding']['venture_capital']} + ${sum(int(v.split('$')[1].split('K')[0]) for k,v in funding['deployment_funding'].items() if k != 'venture_capital')}K")
+    print(f"   Research Track: ${research_total / 1000:.0f}K")
+    print(f"   Deployment Track: ${deployment_total / 1_000_000:.1f}M")
     print(f"   Total Target: {funding['total_funding_target']}")
     
     print(f"\n✅ DUAL-TRACK ADVANTAGES:")
@@ -4,24 +4,156 @@
 Implementation of "It's turtles all the way down" architecture
 """
 
+import asyncio
+import base64
+import itertools
 import json
-import hashlib
+import re
+import string
+import threading
 import time
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, List, Optional
 import subprocess
 import os
 
+try:
+    import requests
+except ImportError:
+    requests = None  # issue creation falls back to the gh CLI
+
+try:
+    import orjson
+
+    def _json_dumps_compact(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _json_dumps_compact(obj) -> str:
+        # separators form stays on the C encoder fast path
+        return json.dumps(obj, separators=(',', ':'))
+
+# Lineage keys are ids with dashes swapped for underscores, lowercased.
+# translate does that in a single pass, and the cache hands back the
+# same string on repeat lookups instead of re-scanning per access
+_NORM = str.maketrans('-', '_')
+
+# All complexity indicators compiled into one alternation at import;
+# _sre scans the mission once for every keyword instead of running
+# fifteen separate substring sweeps per call. (pyahocorasick would give
+# a true automaton, but the compiled alternation needs no dependency.)
+_COMPLEXITY_BUCKETS = {
+    "simple": ("simple", "basic", "straightforward", "quick", "easy"),
+    "complex": ("complex", "difficult", "unknown", "research", "architecture"),
+    "scale": ("large", "massive", "enterprise", "distributed", "fleet"),
+}
+_INDICATOR_BUCKET = {indicator: bucket
+                     for bucket, indicators in _COMPLEXITY_BUCKETS.items()
+                     for indicator in indicators}
+_INDICATOR_RE = re.compile("|".join(_INDICATOR_BUCKET))
+
+# Parsed once at import: substitute() is a single pass over the template
+# with dict lookups only at $name positions, and the static bootstrap /
+# protocol sections are never re-interpolated per turtle
+_BODY_TEMPLATE = string.Template("""## 🐢 Turtle Spawning Coordination Issue
+
+### Turtle Identification
+- **🐢 Turtle Agent**: $id
+- **🥚 Spawned By**: $parent_chain
+- **🌊 Turtle Generation**: $generation
+- **🎯 Specialization**: $specialization
+- **👤 Human Authority Chain**: Human → PrimeTurtle-PRIME → $id
+- **📅 Timestamp**: $spawned_at
+- **🔍 Context**: $mission
+
+### Spawning Justification
+**Problem Complexity**: $complexity_level
+**Turtle Response**: $turtle_response
+
+### Mission Assignment
+$mission
+
+### Success Criteria
+$success_criteria
+
+### Bootstrap Instructions for New Turtle
+```bash
+# Navigate to turtle workspace
+cd /home/tupshin/turtle/prime-turtle
+
+# Load turtle context
+cat README.md
+
+# Boot turtle microkernel  
+./turtle
+
+# Register with lineage tracking
+python3 SPAWN_TURTLE.py --register $id --parent $parent_id
+
+# Activate turtle mode
+# Say: "turtle"
+```
+
+### Coordination Protocol
+- **Report progress** via comments on this issue
+- **Request assistance** by mentioning parent turtle: @$parent_id
+- **Complete mission** by closing this issue with results
+- **Spawn sub-turtles** if needed using same protocol
+
+---
+*🐢 Recursive Turtle Spawning System - "It's turtles all the way down"*
+""")
+
+@lru_cache(maxsize=4096)
+def _normalize(turtle_id: str) -> str:
+    return turtle_id.translate(_NORM).lower()
+
 class TurtleSpawningSystem:
     def __init__(self):
         self.lineage_file = '.turtle/turtle_lineage.json'
+        self.lineage_log = '.turtle/turtle_lineage.jsonl'
         self.ensure_lineage_tracking()
-        
-    def ensure_lineage_tracking(self):
-        """Initialize turtle genealogy tracking"""
-        os.makedirs('.turtle', exist_ok=True)
-        if not os.path.exists(self.lineage_file):
-            initial_lineage = {
+        self._lineage = self._load_lineage()
+        # One keep-alive session shared by all issue creation: a single
+        # TCP+TLS connection is reused across the fleet instead of
+        # paying a gh subprocess fork/exec plus a fresh TLS handshake
+        # per turtle
+        self._gh_repo = os.environ.get('GITHUB_REPOSITORY')
+        self._gh = None
+        if requests is not None and self._gh_repo and os.environ.get('GH_TOKEN'):
+            self._gh = requests.Session()
+            self._gh.headers.update({
+                "Authorization": f"token {os.environ['GH_TOKEN']}",
+                "Accept": "application/vnd.github+json",
+            })
+        # One buffered handle held for the spawner's lifetime: each spawn
+        # appends a single compact JSONL line instead of re-reading and
+        # re-writing the whole pretty-printed snapshot (O(fleet) bytes
+        # of I/O and JSON work per spawn)
+        self._log = open(self.lineage_log, 'a', buffering=1 << 16)
+        # Serializes lineage mutation + log appends when swarm spawns
+        # run concurrently; the network round-trip happens outside it
+        self._lineage_lock = threading.Lock()
+        # C-implemented and atomic under the GIL, so concurrent swarm
+        # spawns get distinct id suffixes without a lock. Seeded from
+        # the wall clock: the 4-char suffix keeps only the counter bits
+        # plus a sliver of the monotonic clock, and a counter that
+        # restarts at 0 would make re-spawned turtles collide with
+        # prior runs' lineage entries on disk
+        self._id_counter = itertools.count(time.time_ns() & 0xFFFF)
+
+    def _load_lineage(self) -> Dict:
+        """Load the snapshot, then replay any pending spawn events
+
+        A missing snapshot just seeds the in-memory dict - nothing
+        touches disk until the first spawn event or compaction.
+        """
+        if os.path.exists(self.lineage_file):
+            with open(self.lineage_file, 'r') as f:
+                lineage = json.load(f)
+        else:
+            lineage = {
                 "prime_turtle": {
                     "id": "PrimeTurtle-PRIME",
                     "generation": "G0",
@@ -35,14 +167,70 @@ class TurtleSpawningSystem:
                 "total_spawned": 1,
                 "max_generation": 0
             }
-            with open(self.lineage_file, 'w') as f:
-                json.dump(initial_lineage, f, indent=2)
+        if os.path.exists(self.lineage_log):
+            with open(self.lineage_log, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        self._apply_spawn_event(lineage, json.loads(line))
+        return lineage
+
+    @staticmethod
+    def _apply_spawn_event(lineage: Dict, turtle_spec: Dict):
+        """Fold one spawn event into the in-memory lineage"""
+        turtle_id = turtle_spec["id"]
+        key = turtle_spec.get("_key") or _normalize(turtle_id)
+        lineage[key] = turtle_spec
+        lineage["active_turtles"].append(turtle_id)
+        lineage["total_spawned"] += 1
+        generation = int(turtle_spec["generation"][1:])
+        lineage["max_generation"] = max(lineage["max_generation"], generation)
+        parent_id = turtle_spec["parent_id"]
+        if parent_id in lineage:
+            lineage[_normalize(parent_id)]["children"].append(turtle_id)
+
+    def _compact(self):
+        """Fold the event log into the snapshot atomically"""
+        self._log.flush()
+        tmp_path = self.lineage_file + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._lineage, f, indent=2)
+        os.rename(tmp_path, self.lineage_file)
+        open(self.lineage_log, 'w').close()  # events now live in the snapshot
+
+    def close(self):
+        """Flush pending events into the snapshot and release the log"""
+        if not self._log.closed:
+            self._compact()
+            self._log.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+        
+    def ensure_lineage_tracking(self):
+        """Initialize turtle genealogy tracking"""
+        os.makedirs('.turtle', exist_ok=True)
     
     def generate_turtle_id(self, turtle_name: str, parent_id: str = None) -> str:
         """Generate unique turtle ID with lineage inheritance"""
-        timestamp = str(int(time.time()))
-        hash_input = f"{turtle_name}-{parent_id or 'PRIME'}-{timestamp}"
-        hex_suffix = hashlib.md5(hash_input.encode()).hexdigest()[:4].upper()
+        # The suffix only needs a few bits of uniqueness, so hashing a
+        # formatted string was pure overhead: splice a monotonic counter
+        # into the low bits of the ns clock and base32 the result - one
+        # integer op and one C-level encode instead of f-string +
+        # encode + hash + hexdigest + slice. The counter occupies the
+        # bits the 4-char suffix actually keeps, so 65536 consecutive
+        # ids are collision-free by construction (and its wall-clock
+        # seed keeps the suffix varying across process restarts, where
+        # the boot-relative clock contributes almost nothing). Masking
+        # to 64 bits
+        # matters: monotonic_ns counts since boot, so on a host up more
+        # than ~3 days the shifted value no longer fits 8 bytes, and
+        # the discarded high bits never reach the suffix anyway.
+        stamp = ((time.monotonic_ns() << 16)
+                 | (next(self._id_counter) & 0xFFFF)) & 0xFFFFFFFFFFFFFFFF
+        hex_suffix = base64.b32encode(stamp.to_bytes(8, 'big')).rstrip(b'=')[-4:].decode('ascii')
         
         if parent_id and parent_id != "PrimeTurtle-PRIME":
             return f"{turtle_name}-{parent_id.split('-')[-1]}-{hex_suffix}"
@@ -53,14 +241,13 @@ class TurtleSpawningSystem:
         """Analyze problem complexity to determine optimal turtle response"""
         problem_lower = problem_description.lower()
         
-        # Complexity indicators
-        simple_indicators = ["simple", "basic", "straightforward", "quick", "easy"]
-        complex_indicators = ["complex", "difficult", "unknown", "research", "architecture"]
-        scale_indicators = ["large", "massive", "enterprise", "distributed", "fleet"]
-        
-        simple_score = sum(1 for indicator in simple_indicators if indicator in problem_lower)
-        complex_score = sum(1 for indicator in complex_indicators if indicator in problem_lower)
-        scale_score = sum(1 for indicator in scale_indicators if indicator in problem_lower)
+        # Distinct indicators only, preserving the old per-keyword
+        # membership scoring
+        hits = set(_INDICATOR_RE.findall(problem_lower))
+        scores = Counter(_INDICATOR_BUCKET[indicator] for indicator in hits)
+        simple_score = scores["simple"]
+        complex_score = scores["complex"]
+        scale_score = scores["scale"]
         
         if scale_score > 0:
             return "massive_scale"
@@ -75,63 +262,35 @@ class TurtleSpawningSystem:
         """Create GitHub issue for turtle coordination with lineage tracking"""
         title = f"🐢 TURTLE SPAWN: {turtle_spec['specialization']} - {turtle_spec['id']}"
         
-        body = f"""## 🐢 Turtle Spawning Coordination Issue
-
-### Turtle Identification
-- **🐢 Turtle Agent**: {turtle_spec['id']}
-- **🥚 Spawned By**: {turtle_spec['parent_chain']}
-- **🌊 Turtle Generation**: {turtle_spec['generation']}
-- **🎯 Specialization**: {turtle_spec['specialization']}
-- **👤 Human Authority Chain**: Human → PrimeTurtle-PRIME → {turtle_spec['id']}
-- **📅 Timestamp**: {turtle_spec['spawned_at']}
-- **🔍 Context**: {turtle_spec['mission']}
-
-### Spawning Justification
-**Problem Complexity**: {turtle_spec['complexity_level']}
-**Turtle Response**: {turtle_spec['turtle_response']}
-
-### Mission Assignment
-{turtle_spec['mission']}
-
-### Success Criteria
-{turtle_spec.get('success_criteria', 'Complete assigned mission and report back via this issue')}
-
-### Bootstrap Instructions for New Turtle
-```bash
-# Navigate to turtle workspace
-cd /home/tupshin/turtle/prime-turtle
-
-# Load turtle context
-cat README.md
-
-# Boot turtle microkernel  
-./turtle
-
-# Register with lineage tracking
-python3 SPAWN_TURTLE.py --register {turtle_spec['id']} --parent {turtle_spec['parent_id']}
-
-# Activate turtle mode
-# Say: "turtle"
-```
-
-### Coordination Protocol
-- **Report progress** via comments on this issue
-- **Request assistance** by mentioning parent turtle: @{turtle_spec['parent_id']}
-- **Complete mission** by closing this issue with results
-- **Spawn sub-turtles** if needed using same protocol
-
----
-*🐢 Recursive Turtle Spawning System - "It's turtles all the way down"*
-"""
+        body = _BODY_TEMPLATE.substitute(
+            turtle_spec,
+            success_criteria=turtle_spec.get(
+                'success_criteria',
+                'Complete assigned mission and report back via this issue'))
         
-        # Create GitHub issue
+        # Create GitHub issue over the pooled REST session when
+        # configured; otherwise fall back to spawning the gh CLI
+        if self._gh is not None:
+            try:
+                response = self._gh.post(
+                    f"https://api.github.com/repos/{self._gh_repo}/issues",
+                    json={"title": title, "body": body, "labels": ["turtle-spawn"]},
+                    timeout=30)
+                response.raise_for_status()
+                issue_url = response.json()["html_url"]
+                print(f"✅ Created coordination issue: {issue_url}")
+                return issue_url
+            except Exception as e:
+                print(f"❌ Failed to create GitHub issue: {e}")
+                return f"LOCAL_COORDINATION_{turtle_spec['id']}"
+
         try:
             cmd = ['gh', 'issue', 'create', '--title', title, '--body', body, '--label', 'turtle-spawn']
             result = subprocess.run(cmd, capture_output=True, text=True, check=True)
             issue_url = result.stdout.strip()
             print(f"✅ Created coordination issue: {issue_url}")
             return issue_url
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, FileNotFoundError) as e:
             print(f"❌ Failed to create GitHub issue: {e}")
             return f"LOCAL_COORDINATION_{turtle_spec['id']}"
     
@@ -139,14 +298,29 @@ python3 SPAWN_TURTLE.py --register {turtle_spec['id']} --parent {turtle_spec['pa
                     parent_id: str = "PrimeTurtle-PRIME") -> Dict:
         """Spawn a new turtle with full lineage tracking"""
         
-        # Load current lineage
-        with open(self.lineage_file, 'r') as f:
-            lineage = json.load(f)
+        # Lineage lives in memory; disk only sees the appended event
+        lineage = self._lineage
         
         # Generate turtle specification
         turtle_id = self.generate_turtle_id(turtle_name, parent_id)
-        parent_gen = int(lineage[parent_id.replace('-', '_').lower()]['generation'][1:]) if parent_id != "PrimeTurtle-PRIME" else 0
+        if parent_id != "PrimeTurtle-PRIME":
+            parent_entry = lineage[_normalize(parent_id)]
+            parent_gen = int(parent_entry['generation'][1:])
+        else:
+            parent_entry = None
+            parent_gen = 0
         generation = f"G{parent_gen + 1}"
+
+        # The parent already stores its own chain, so extending it is one
+        # O(1) append instead of re-walking the lineage to the root on
+        # every spawn; build_parent_chain stays as the fallback for
+        # legacy lineage files without a stored chain
+        if parent_entry is None:
+            parent_chain = "PrimeTurtle-PRIME"
+        elif parent_entry.get("parent_chain"):
+            parent_chain = parent_entry["parent_chain"] + " → " + parent_id
+        else:
+            parent_chain = self.build_parent_chain(parent_id, lineage)
         
         complexity_level = self.assess_complexity(mission)
         turtle_response_map = {
@@ -157,13 +331,15 @@ python3 SPAWN_TURTLE.py --register {turtle_spec['id']} --parent {turtle_spec['pa
             "massive_scale": "turtle_hierarchy_management"
         }
         
+        turtle_key = _normalize(turtle_id)
         turtle_spec = {
             "id": turtle_id,
+            "_key": turtle_key,
             "name": turtle_name,
             "specialization": specialization,
             "mission": mission,
             "parent_id": parent_id,
-            "parent_chain": self.build_parent_chain(parent_id, lineage),
+            "parent_chain": parent_chain,
             "generation": generation,
             "complexity_level": complexity_level,
             "turtle_response": turtle_response_map[complexity_level],
@@ -177,19 +353,12 @@ python3 SPAWN_TURTLE.py --register {turtle_spec['id']} --parent {turtle_spec['pa
         issue_url = self.create_github_coordination_issue(turtle_spec)
         turtle_spec["github_issue"] = issue_url
         
-        # Update lineage tracking
-        lineage[turtle_id.replace('-', '_').lower()] = turtle_spec
-        lineage["active_turtles"].append(turtle_id)
-        lineage["total_spawned"] += 1
-        lineage["max_generation"] = max(lineage["max_generation"], parent_gen + 1)
-        
-        # Add to parent's children
-        if parent_id in lineage:
-            lineage[parent_id.replace('-', '_').lower()]["children"].append(turtle_id)
-        
-        # Save updated lineage
-        with open(self.lineage_file, 'w') as f:
-            json.dump(lineage, f, indent=2)
+        # Update lineage tracking and append one compact line - the
+        # separators form stays on the C encoder fast path, unlike
+        # indent=2 which falls back to the Python-level formatter
+        with self._lineage_lock:
+            self._apply_spawn_event(lineage, turtle_spec)
+            self._log.write(_json_dumps_compact(turtle_spec) + '\n')
         
         print(f"🐢 Spawned: {turtle_id}")
         print(f"🎯 Specialization: {specialization}")
@@ -199,6 +368,26 @@ python3 SPAWN_TURTLE.py --register {turtle_spec['id']} --parent {turtle_spec['pa
         
         return turtle_spec
     
+    async def spawn_swarm_async(self, count: int, domain: str, mission: str) -> List[Dict]:
+        """Spawn a turtle swarm concurrently
+
+        Each spawn is dominated by the GitHub round-trip, so the swarm
+        issues all of them at once instead of paying count sequential
+        RTTs; the semaphore caps in-flight requests and the lineage
+        lock keeps the event log ordered.
+        """
+        semaphore = asyncio.Semaphore(16)
+
+        async def spawn_one(i: int) -> Dict:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.spawn_turtle,
+                    f"Scout{i+1}Turtle",
+                    f"{domain}_reconnaissance",
+                    f"{mission} (swarm member {i+1}/{count})")
+
+        return await asyncio.gather(*(spawn_one(i) for i in range(count)))
+
     def build_parent_chain(self, parent_id: str, lineage: Dict) -> str:
         """Build complete parent chain for turtle identification"""
         if parent_id == "PrimeTurtle-PRIME":
@@ -208,7 +397,7 @@ python3 SPAWN_TURTLE.py --register {turtle_spec['id']} --parent {turtle_spec['pa
         current = parent_id
         
         while current != "PrimeTurtle-PRIME":
-            parent_key = current.replace('-', '_').lower()
+            parent_key = _normalize(current)
             if parent_key in lineage and lineage[parent_key].get('parent_id'):
                 current = lineage[parent_key]['parent_id']
                 chain.append(current)
@@ -219,8 +408,8 @@ python3 SPAWN_TURTLE.py --register {turtle_spec['id']} --parent {turtle_spec['pa
     
     def status(self) -> Dict:
         """Show current turtle fleet status"""
-        with open(self.lineage_file, 'r') as f:
-            lineage = json.load(f)
+        self._compact()
+        lineage = self._lineage
         
         active_count = len(lineage["active_turtles"])
         total_spawned = lineage["total_spawned"] 
@@ -271,11 +460,7 @@ def main():
         mission = sys.argv[4]
         
         print(f"🌊 Spawning turtle swarm: {count} turtles for {domain}")
-        for i in range(count):
-            turtle_name = f"Scout{i+1}Turtle"
-            specialization = f"{domain}_reconnaissance"
-            swarm_mission = f"{mission} (swarm member {i+1}/{count})"
-            spawner.spawn_turtle(turtle_name, specialization, swarm_mission)
+        asyncio.run(spawner.spawn_swarm_async(count, domain, mission))
             
     else:
         print("❌ Invalid command. Use 'spawn', 'status', or 'swarm'")
@@ -5,8 +5,10 @@ Complete anonymization and stealth capabilities for turtle operations
 """
 
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Optional, List
 import re
+import sys
 
 class StealthLevel(Enum):
     VISIBLE = "turtle_visible"        # Standard turtle with 🐢 markers
@@ -22,55 +24,210 @@ class ContextType(Enum):
     ACADEMIC_SUBMISSION = "academic_submission"
     ENTERPRISE_DEMO = "enterprise_demo"
 
+def _build_mask_sub(masks):
+    """Compile all mask keys into one alternation and return a callable
+
+    The whole text is scanned once instead of once per key, and sorting
+    longest-first means multi-word terms ("turtle fleet") win over the
+    bare substring ("turtle") that previously shadowed them.
+    """
+    parts = sorted(masks.items(), key=lambda kv: -len(kv[0]))
+    pattern = re.compile(
+        '|'.join(f'(?P<g{i}>\\b{re.escape(key)}\\b)' for i, (key, _) in enumerate(parts)),
+        # Mask keys are plain ASCII: opting out of Unicode case folding
+        # keeps the case-insensitive scan on the cheap ASCII tables
+        re.IGNORECASE | re.ASCII)
+    replacements = {f'g{i}': mask for i, (_, mask) in enumerate(parts)}
+    return lambda text: pattern.sub(lambda m: replacements[m.lastgroup], text)
+
+def _build_phrase_sub(phrases):
+    """Single-pass replacement for what was a chain of str.replace calls
+
+    Each .replace scanned the whole string again; one alternation over
+    the exact phrases (longest first) does them all in one pass.
+    """
+    pattern = re.compile('|'.join(
+        re.escape(phrase) for phrase in sorted(phrases, key=len, reverse=True)))
+    return lambda text: pattern.sub(lambda m: phrases[m.group(0)], text)
+
+# Constant tables and their compiled forms, built once at import -
+# spawning a stealth interface per turtle no longer re-allocates the
+# dicts or recompiles any pattern
+
+# LLM anonymization mappings
+_LLM_MASKS = {
+    # Provider masking
+    "claude": "reasoning system",
+    "anthropic": "ai backend provider",
+    "openai": "language model provider", 
+    "gpt": "generative model",
+    "bedrock": "cloud ai service",
+    
+    # Model masking  
+    "claude-3": "advanced language model",
+    "gpt-4": "large language model",
+    "llama": "open source model",
+    
+    # Technical masking
+    "token": "processing unit",
+    "context window": "processing capacity",
+    "training data": "knowledge base",
+    "fine-tuning": "specialization process"
+}
+
+# Turtle-specific term masking
+_TURTLE_MASKS = {
+    "turtle": "agent",
+    "turtle fleet": "distributed system", 
+    "turtle spawning": "process delegation",
+    "turtle coordination": "system orchestration",
+    "prime turtle": "primary coordinator",
+    "turtle identity": "agent specification",
+    "turtle capabilities": "system features"
+}
+
+# Context-based stealth settings
+_CONTEXT_STEALTH_MAP = {
+    ContextType.DEVELOPMENT: StealthLevel.VISIBLE,
+    ContextType.RESEARCH_PAPER: StealthLevel.ANONYMOUS,
+    ContextType.BUSINESS_PRESENTATION: StealthLevel.DISCRETE,
+    ContextType.SECURITY_AUDIT: StealthLevel.STEALTH,
+    ContextType.ACADEMIC_SUBMISSION: StealthLevel.ANONYMOUS,
+    ContextType.ENTERPRISE_DEMO: StealthLevel.DISCRETE
+}
+
+# Context detection keywords, checked in declared priority order
+_CONTEXT_INDICATORS = {
+    ContextType.RESEARCH_PAPER: ["paper", "research", "academic", "publication", "journal", "conference"],
+    ContextType.BUSINESS_PRESENTATION: ["presentation", "business", "executive", "stakeholder", "roi", "market"],
+    ContextType.SECURITY_AUDIT: ["security", "audit", "penetration", "vulnerability", "compliance"],
+    ContextType.ACADEMIC_SUBMISSION: ["submission", "peer review", "academic", "university", "professor"],
+    ContextType.ENTERPRISE_DEMO: ["demo", "enterprise", "client", "customer", "showcase"],
+    ContextType.DEVELOPMENT: ["development", "coding", "implementation", "debugging", "testing"]
+}
+
+# Tokenizing the text once and intersecting frozensets replaces any
+# keyword scan: set-and-set intersection is O(words) regardless of how
+# many indicators exist. Multi-word indicators ("peer review") can't
+# appear in a word set, so they keep a substring fallback per context.
+_WORD_RE = re.compile(r'\w+')
+_CTX_WORD_SETS = {
+    context: frozenset(k for k in keywords if ' ' not in k)
+    for context, keywords in _CONTEXT_INDICATORS.items()
+}
+_CTX_PHRASES = {
+    context: tuple(k for k in keywords if ' ' in k)
+    for context, keywords in _CONTEXT_INDICATORS.items()
+}
+
+# Each mask family fused into a single alternation so a response is
+# scanned once, not once per mask key. When both families apply at
+# once they share a single combined scan (the keys don't overlap, so
+# one pass gives the same result as two).
+_LLM_SUB = _build_mask_sub(_LLM_MASKS)
+_TURTLE_SUB = _build_mask_sub(_TURTLE_MASKS)
+_COMBINED_SUB = _build_mask_sub({**_LLM_MASKS, **_TURTLE_MASKS})
+_TURTLE_WORD_RE = re.compile(r'\bturtle\b', re.IGNORECASE | re.ASCII)
+_STEALTH_PHRASE_SUB = _build_phrase_sub({
+    "I am turtle": "The system",
+    "This turtle": "This system",
+    "My turtle": "System",
+})
+_ANON_PHRASE_SUB = _build_phrase_sub({
+    "I am turtle": "I'll help with that",
+    "This turtle": "This approach",
+    "Turtle capabilities": "Available capabilities",
+    "turtle spawning": "process creation",
+    "turtle fleet": "distributed processing",
+})
+
+# Deleting fixed codepoints via translate is a raw C scan - cheaper
+# than running the regex engine for single characters
+_TURTLE_EMOJI_DEL = str.maketrans('', '', '🐢')
+_ALL_EMOJI_DEL = str.maketrans('', '', '🐢🥷')
+_MULTI_SPACE_RE = re.compile(r'  +')
+
+def _strip_emoji(text: str, table) -> str:
+    """Remove marker emoji and the whitespace they carried"""
+    stripped = text.translate(table)
+    if len(stripped) != len(text):
+        # translate leaves surrounding spaces behind; collapse the
+        # doubles the old regex path used to consume
+        stripped = _MULTI_SPACE_RE.sub(' ', stripped).lstrip()
+    return stripped
+
+# Stealth levels form a strict escalation; ranking them lets the
+# transformation run as one fall-through pipeline instead of four
+# copy-pasted branches
+_LEVEL_RANK = {
+    StealthLevel.VISIBLE: 0,
+    StealthLevel.DISCRETE: 1,
+    StealthLevel.STEALTH: 2,
+    StealthLevel.ANONYMOUS: 3,
+}
+
+# Per-level specifics that don't stack: DISCRETE keeps the 🥷 marker
+# and has its own single phrase rewrite, while STEALTH and ANONYMOUS
+# each use their own phrase map
+_LEVEL_EMOJI = {
+    StealthLevel.DISCRETE: _TURTLE_EMOJI_DEL,
+    StealthLevel.STEALTH: _ALL_EMOJI_DEL,
+    StealthLevel.ANONYMOUS: _ALL_EMOJI_DEL,
+}
+_LEVEL_PHRASES = {
+    StealthLevel.DISCRETE:
+        lambda text: text.replace("I am turtle", "I am the system"),
+    StealthLevel.STEALTH: _STEALTH_PHRASE_SUB,
+    StealthLevel.ANONYMOUS:
+        lambda text: _TURTLE_WORD_RE.sub('agent', _ANON_PHRASE_SUB(text)),
+}
+
+@lru_cache(maxsize=32)
+def _transform(level: StealthLevel, llm_enabled: bool, response: str) -> str:
+    """Pure transformation for one (level, anonymization, text) triple
+
+    Depends only on its arguments and the module constants, so repeated
+    responses - boilerplate status lines, canned acknowledgements - come
+    straight out of the lru_cache without touching the regex engine.
+    Stages accumulate by level rank: emoji stripping from DISCRETE up,
+    turtle masking from STEALTH up, then the level's phrase rewrite.
+    """
+    rank = _LEVEL_RANK[level]
+    masking = rank >= _LEVEL_RANK[StealthLevel.STEALTH]
+    # LLM and turtle masking collapse into one combined scan when both
+    # apply; a lone LLM pass only happens below STEALTH
+    transformed = _LLM_SUB(response) if llm_enabled and not masking else response
+    
+    if rank >= _LEVEL_RANK[StealthLevel.DISCRETE]:
+        transformed = _strip_emoji(transformed, _LEVEL_EMOJI[level])
+    if masking:
+        transformed = (_COMBINED_SUB if llm_enabled else _TURTLE_SUB)(transformed)
+    phrases = _LEVEL_PHRASES.get(level)
+    if phrases is not None:
+        transformed = phrases(transformed)
+    
+    return transformed
+
 class StealthTurtleInterface:
     """Interface for stealth turtle operations with full anonymization"""
     
     def __init__(self):
+        # Only mutable per-interface state lives here; the constant
+        # tables and compiled patterns are shared module-level objects
         self.current_stealth_level = StealthLevel.VISIBLE
         self.llm_anonymization_enabled = False
         self.context_auto_detection = True
         
-        # LLM anonymization mappings
-        self.llm_masks = {
-            # Provider masking
-            "claude": "reasoning system",
-            "anthropic": "ai backend provider",
-            "openai": "language model provider", 
-            "gpt": "generative model",
-            "bedrock": "cloud ai service",
-            
-            # Model masking  
-            "claude-3": "advanced language model",
-            "gpt-4": "large language model",
-            "llama": "open source model",
-            
-            # Technical masking
-            "token": "processing unit",
-            "context window": "processing capacity",
-            "training data": "knowledge base",
-            "fine-tuning": "specialization process"
-        }
-        
-        # Turtle-specific term masking
-        self.turtle_masks = {
-            "turtle": "agent",
-            "turtle fleet": "distributed system", 
-            "turtle spawning": "process delegation",
-            "turtle coordination": "system orchestration",
-            "prime turtle": "primary coordinator",
-            "turtle identity": "agent specification",
-            "turtle capabilities": "system features"
-        }
-        
-        # Context-based stealth settings
-        self.context_stealth_map = {
-            ContextType.DEVELOPMENT: StealthLevel.VISIBLE,
-            ContextType.RESEARCH_PAPER: StealthLevel.ANONYMOUS,
-            ContextType.BUSINESS_PRESENTATION: StealthLevel.DISCRETE,
-            ContextType.SECURITY_AUDIT: StealthLevel.STEALTH,
-            ContextType.ACADEMIC_SUBMISSION: StealthLevel.ANONYMOUS,
-            ContextType.ENTERPRISE_DEMO: StealthLevel.DISCRETE
-        }
+        self.llm_masks = _LLM_MASKS
+        self.turtle_masks = _TURTLE_MASKS
+        self.context_stealth_map = _CONTEXT_STEALTH_MAP
+        self.context_indicators = _CONTEXT_INDICATORS
+        # Steady-state chat loops pass the same context hint over and
+        # over; memoizing skips the keyword scan entirely on repeats.
+        # Keyed on a bounded prefix so a pathological caller can't grow
+        # the cache without bound.
+        self._ctx_cache: Dict[str, ContextType] = {}
+        self._llm_sub = _LLM_SUB
     
     def set_stealth_level(self, level: StealthLevel):
         """Manually set stealth level"""
@@ -90,21 +247,28 @@ class StealthTurtleInterface:
     def detect_context(self, conversation_text: str) -> ContextType:
         """Auto-detect conversation context for stealth adjustment"""
         text_lower = conversation_text.lower()
+        # Key on the whole string: a truncated prefix would alias
+        # conversations that diverge past the cut and hand back the
+        # wrong context. The dict stores a reference, and the entry
+        # cap below bounds memory regardless of key length.
+        cache_key = text_lower
+        cached = self._ctx_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
-        context_indicators = {
-            ContextType.RESEARCH_PAPER: ["paper", "research", "academic", "publication", "journal", "conference"],
-            ContextType.BUSINESS_PRESENTATION: ["presentation", "business", "executive", "stakeholder", "roi", "market"],
-            ContextType.SECURITY_AUDIT: ["security", "audit", "penetration", "vulnerability", "compliance"],
-            ContextType.ACADEMIC_SUBMISSION: ["submission", "peer review", "academic", "university", "professor"],
-            ContextType.ENTERPRISE_DEMO: ["demo", "enterprise", "client", "customer", "showcase"],
-            ContextType.DEVELOPMENT: ["development", "coding", "implementation", "debugging", "testing"]
-        }
-        
-        for context, keywords in context_indicators.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return context
+        detected = ContextType.DEVELOPMENT  # Default
+        words = set(_WORD_RE.findall(text_lower))
+        for context in self.context_indicators:
+            if (not words.isdisjoint(_CTX_WORD_SETS[context])
+                    or any(phrase in text_lower
+                           for phrase in _CTX_PHRASES[context])):
+                detected = context
+                break
         
-        return ContextType.DEVELOPMENT  # Default
+        if len(self._ctx_cache) >= 1024:
+            self._ctx_cache.clear()
+        self._ctx_cache[cache_key] = detected
+        return detected
     
     def auto_adjust_stealth(self, conversation_text: str):
         """Automatically adjust stealth based on detected context"""
@@ -123,65 +287,19 @@ class StealthTurtleInterface:
         if not self.llm_anonymization_enabled:
             return text
         
-        anonymized = text
-        
-        # Apply LLM masking
-        for original, mask in self.llm_masks.items():
-            # Case-insensitive replacement
-            anonymized = re.sub(r'\b' + re.escape(original) + r'\b', mask, anonymized, flags=re.IGNORECASE)
-        
-        return anonymized
+        # Apply LLM masking in one fused scan
+        return self._llm_sub(text)
     
     def apply_stealth_transformation(self, response: str) -> str:
         """Apply stealth transformations based on current level"""
-        transformed = response
-        
-        # Always anonymize LLM if enabled
-        transformed = self.anonymize_llm_references(transformed)
-        
-        if self.current_stealth_level == StealthLevel.VISIBLE:
-            # No transformation needed - standard turtle mode
-            return transformed
-        
-        elif self.current_stealth_level == StealthLevel.DISCRETE:
-            # Minimal turtle markers
-            transformed = re.sub(r'🐢\s*', '', transformed)  # Remove turtle emoji
-            transformed = transformed.replace("I am turtle", "I am the system")
-            
-        elif self.current_stealth_level == StealthLevel.STEALTH:
-            # No turtle identity visible
-            transformed = re.sub(r'🐢\s*', '', transformed)
-            transformed = re.sub(r'🥷\s*', '', transformed)  # Remove stealth emoji too
-            
-            # Replace turtle terminology
-            for original, mask in self.turtle_masks.items():
-                transformed = re.sub(r'\b' + re.escape(original) + r'\b', mask, transformed, flags=re.IGNORECASE)
-            
-            # Transform first-person turtle references
-            transformed = transformed.replace("I am turtle", "The system")
-            transformed = transformed.replace("This turtle", "This system")
-            transformed = transformed.replace("My turtle", "System")
-            
-        elif self.current_stealth_level == StealthLevel.ANONYMOUS:
-            # Appears completely generic
-            transformed = re.sub(r'🐢\s*', '', transformed)
-            transformed = re.sub(r'🥷\s*', '', transformed)
-            
-            # Replace all turtle terminology
-            for original, mask in self.turtle_masks.items():
-                transformed = re.sub(r'\b' + re.escape(original) + r'\b', mask, transformed, flags=re.IGNORECASE)
-            
-            # Make responses appear human-like or generic system-like
-            transformed = transformed.replace("I am turtle", "I'll help with that")
-            transformed = transformed.replace("This turtle", "This approach")
-            transformed = transformed.replace("Turtle capabilities", "Available capabilities")
-            transformed = transformed.replace("turtle spawning", "process creation")
-            transformed = transformed.replace("turtle fleet", "distributed processing")
-            
-            # Remove any remaining turtle-specific language
-            transformed = re.sub(r'\bturtle\b', 'agent', transformed, flags=re.IGNORECASE)
+        # Common path: fully visible with no anonymization - return the
+        # response untouched instead of paying even a cache lookup
+        if (self.current_stealth_level == StealthLevel.VISIBLE
+                and not self.llm_anonymization_enabled):
+            return response
         
-        return transformed
+        return _transform(self.current_stealth_level,
+                          self.llm_anonymization_enabled, response)
     
     def stealth_response(self, original_response: str, context_hint: str = "") -> str:
         """Generate stealth response with full anonymization"""
@@ -210,10 +328,10 @@ class StealthTurtleInterface:
                 
             transformed = self.apply_stealth_transformation(sample_response)
             
-            print(f"\n{level.value.upper()}:")
-            print(f"   {transformed}")
+            # One write per level report instead of two flushed prints
+            sys.stdout.write(f"\n{level.value.upper()}:\n   {transformed}\n")
         
-        print(f"\n🎭 Complete anonymization and stealth capabilities operational!")
+        sys.stdout.write("\n🎭 Complete anonymization and stealth capabilities operational!\n")
 
 # Global stealth interface
 _stealth_interface = None
@@ -4,10 +4,13 @@
 Restrict turtle attention to specific topics with configurable enforcement
 """
 
+from collections import Counter
 from enum import Enum
 from typing import List, Dict, Optional, Set
 from dataclasses import dataclass
 import re
+import string
+import sys
 import time
 
 class LockdownLevel(Enum):
@@ -22,7 +25,7 @@ class TopicRelevance(Enum):
     METHODOLOGY = "methodology"      # Relevant methodology
     OFF_TOPIC = "off_topic"         # Not relevant
 
-@dataclass
+@dataclass(slots=True)
 class TopicLock:
     """Topic lockdown configuration"""
     topics: List[str]
@@ -32,13 +35,41 @@ class TopicLock:
     allow_methodology: bool = True
     allow_tools: bool = True
     locked_at: str = ""
+    locked_at_mono: float = 0.0  # monotonic clock; duration math without strptime
     locked_by: str = "human"
+    # Prebuilt at activation: topics are fixed for the life of the lock,
+    # so every query pays one findall over exactly the locked keywords
+    _scanner: Optional[re.Pattern] = None
+    _kw_topics: Optional[Dict[str, List[str]]] = None
+    _kw_implies: Optional[Dict[str, List[str]]] = None
+    _topics_str: str = ""  # ', '.join(topics), invariant per lock
+    _context_str: str = ""  # rendered topic context, invariant per lock
+
+# Compiled once: the methodology check runs on every query that isn't
+# an outright topic hit, and one word-boundary alternation beats six
+# separate substring scans
+_METHODOLOGY_RE = re.compile(
+    r'\b(?:how|method|approach|technique|process|implement)\b')
 
 class TopicLockdownInterface:
     """Interface for turtle topic lockdown protocols"""
     
+    TOPIC_CONTEXTS = {
+        "entropy_reduction": "semantic disambiguation and system precision",
+        "category_theory": "mathematical foundations and morphisms",
+        "research_writing": "academic paper development and publication",
+        "lachmann_interview": "origins of life and information theory research",
+        "turtle_development": "turtle system architecture and capabilities",
+        "stealth_protocols": "anonymization and visibility control",
+        "distributed_systems": "coordination and reliability engineering",
+        "business_presentation": "stakeholder communication and market positioning"
+    }
+    
     def __init__(self):
         self.current_lock: Optional[TopicLock] = None
+        # Plain bool mirror of current_lock: the hot unlocked path can
+        # test it without touching the dataclass at all
+        self.locked: bool = False
         self.topic_keywords = {
             "entropy_reduction": ["entropy", "disambiguation", "semantic", "ambiguity", "precision", "cnl"],
             "category_theory": ["category", "morphism", "functor", "categorical", "composition", "object"],
@@ -56,6 +87,13 @@ class TopicLockdownInterface:
             "strict": "⛔ Off-topic query blocked. Current focus: {topic}. Please rephrase to relate to {context}.",
             "obsessed": "🔥 I can't think about anything except {context}! This is the most fascinating research connection I've ever encountered. How does your question connect to {topic}? I must understand every aspect of this work!"
         }
+        # Parsed once: .format() re-parses the format minilanguage on
+        # every blocked query, substitute() is a single pass
+        self._redirection_templates = {
+            name: string.Template(
+                text.replace('{topic}', '${topic}').replace('{context}', '${context}'))
+            for name, text in self.redirection_messages.items()
+        }
     
     def activate_lockdown(self, topics: List[str], level: LockdownLevel = LockdownLevel.FOCUSED, 
                          strictness: float = 0.7, **kwargs) -> bool:
@@ -69,24 +107,56 @@ class TopicLockdownInterface:
             allow_methodology=kwargs.get('allow_methodology', True), 
             allow_tools=kwargs.get('allow_tools', True),
             locked_at=time.strftime("%Y-%m-%d %H:%M:%S"),
+            locked_at_mono=time.monotonic(),
             locked_by=kwargs.get('locked_by', 'human')
         )
+        self.locked = True
+        
+        # Specialize the relevance scanner to this lock: keywords of
+        # unlocked topics never enter the scan. (A pyahocorasick
+        # automaton would be the dependency-backed version of the same
+        # single-pass idea.)
+        kw_topics: Dict[str, List[str]] = {}
+        for topic in topics:
+            for keyword in self.topic_keywords.get(topic, [topic]):
+                kw_topics.setdefault(keyword, []).append(topic)
+        self.current_lock._topics_str = ', '.join(topics)
+        self.current_lock._context_str = ', '.join(
+            self.TOPIC_CONTEXTS.get(topic, topic) for topic in topics)
+        self.current_lock._kw_topics = kw_topics
+        self.current_lock._scanner = re.compile('|'.join(
+            sorted(map(re.escape, kw_topics), key=len, reverse=True)))
+        # Nested keywords still count when only the longer one wins
+        self.current_lock._kw_implies = {
+            keyword: [other for other in kw_topics
+                      if other != keyword and other in keyword]
+            for keyword in kw_topics
+        }
         
-        print(f"🎯 TOPIC LOCKDOWN ACTIVATED")
-        print(f"   Topics: {', '.join(topics)}")
-        print(f"   Level: {level.value}")
-        print(f"   Strictness: {strictness:.1f}")
-        print(f"   Related topics allowed: {self.current_lock.allow_related}")
+        # One buffered write instead of five prints - five fewer
+        # flushes when stdout is a pipe or tty
+        out = [
+            "🎯 TOPIC LOCKDOWN ACTIVATED",
+            f"   Topics: {self.current_lock._topics_str}",
+            f"   Level: {level.value}",
+            f"   Strictness: {strictness:.1f}",
+            f"   Related topics allowed: {self.current_lock.allow_related}",
+        ]
+        sys.stdout.write('\n'.join(out) + '\n')
         
         return True
     
     def deactivate_lockdown(self) -> bool:
         """Remove topic lockdown restrictions"""
         if self.current_lock:
-            print(f"🔓 TOPIC LOCKDOWN DEACTIVATED")
-            print(f"   Was locked on: {', '.join(self.current_lock.topics)}")
-            print(f"   Duration: {self._get_lockdown_duration()}")
+            out = [
+                "🔓 TOPIC LOCKDOWN DEACTIVATED",
+                f"   Was locked on: {', '.join(self.current_lock.topics)}",
+                f"   Duration: {self._get_lockdown_duration()}",
+            ]
+            sys.stdout.write('\n'.join(out) + '\n')
             self.current_lock = None
+            self.locked = False
             return True
         else:
             print("ℹ️  No active topic lockdown to deactivate")
@@ -98,11 +168,21 @@ class TopicLockdownInterface:
             return TopicRelevance.ON_TOPIC  # No restrictions
         
         query_lower = query.lower()
+        lock = self.current_lock
+        
+        # One scan over the lock's own scanner collects every keyword
+        # hit; expand nested keywords and tally per topic
+        hits = set(lock._scanner.findall(query_lower))
+        for keyword in tuple(hits):
+            hits.update(lock._kw_implies[keyword])
+        topic_counts = Counter()
+        for keyword in hits:
+            for topic in lock._kw_topics[keyword]:
+                topic_counts[topic] += 1
         
         # Check direct topic keyword matches
-        for topic in self.current_lock.topics:
-            topic_keywords = self.topic_keywords.get(topic, [topic])
-            direct_matches = sum(1 for keyword in topic_keywords if keyword in query_lower)
+        for topic in lock.topics:
+            direct_matches = topic_counts[topic]
             
             if direct_matches >= 2:
                 return TopicRelevance.ON_TOPIC
@@ -111,9 +191,8 @@ class TopicLockdownInterface:
                     return TopicRelevance.RELATED
         
         # Check methodology relevance
-        methodology_keywords = ["how", "method", "approach", "technique", "process", "implement"]
-        if (self.current_lock.allow_methodology and 
-            any(keyword in query_lower for keyword in methodology_keywords)):
+        if (self.current_lock.allow_methodology and
+                _METHODOLOGY_RE.search(query_lower)):
             return TopicRelevance.METHODOLOGY
         
         # Default: off-topic
@@ -131,18 +210,16 @@ class TopicLockdownInterface:
             return True, ""
         
         elif relevance == TopicRelevance.RELATED and self.current_lock.allow_related:
-            return True, f"🎯 Relating to locked topic: {', '.join(self.current_lock.topics)}"
+            return True, f"🎯 Relating to locked topic: {self.current_lock._topics_str}"
         
         elif relevance == TopicRelevance.METHODOLOGY and self.current_lock.allow_methodology:
-            return True, f"📋 Methodology question related to: {', '.join(self.current_lock.topics)}"
+            return True, f"📋 Methodology question related to: {self.current_lock._topics_str}"
         
         else:
             # Generate redirection message
             strictness_level = self._get_strictness_level()
-            message_template = self.redirection_messages[strictness_level]
-            
-            redirection = message_template.format(
-                topic=', '.join(self.current_lock.topics),
+            redirection = self._redirection_templates[strictness_level].substitute(
+                topic=self.current_lock._topics_str,
                 context=self._get_topic_context()
             )
             
@@ -160,39 +237,28 @@ class TopicLockdownInterface:
             return "gentle"
     
     def _get_topic_context(self) -> str:
-        """Generate contextual description of locked topics"""
+        """Contextual description of locked topics, rendered at activation"""
         if not self.current_lock:
             return "general topics"
         
-        contexts = {
-            "entropy_reduction": "semantic disambiguation and system precision",
-            "category_theory": "mathematical foundations and morphisms",
-            "research_writing": "academic paper development and publication",
-            "lachmann_interview": "origins of life and information theory research",
-            "turtle_development": "turtle system architecture and capabilities",
-            "stealth_protocols": "anonymization and visibility control",
-            "distributed_systems": "coordination and reliability engineering",
-            "business_presentation": "stakeholder communication and market positioning"
-        }
-        
-        topic_contexts = [contexts.get(topic, topic) for topic in self.current_lock.topics]
-        return ', '.join(topic_contexts)
+        return self.current_lock._context_str
     
     def _get_lockdown_duration(self) -> str:
         """Calculate lockdown duration"""
-        if not self.current_lock or not self.current_lock.locked_at:
+        if not self.current_lock or not self.current_lock.locked_at_mono:
             return "unknown"
         
-        import datetime
-        locked_time = datetime.datetime.strptime(self.current_lock.locked_at, "%Y-%m-%d %H:%M:%S")
-        duration = datetime.datetime.now() - locked_time
+        # Monotonic float subtract - no strptime parse per status read,
+        # and immune to wall-clock adjustments. The locked_at string is
+        # kept purely for display.
+        elapsed = time.monotonic() - self.current_lock.locked_at_mono
         
-        if duration.total_seconds() < 60:
-            return f"{int(duration.total_seconds())} seconds"
-        elif duration.total_seconds() < 3600:
-            return f"{int(duration.total_seconds() / 60)} minutes"
+        if elapsed < 60:
+            return f"{int(elapsed)} seconds"
+        elif elapsed < 3600:
+            return f"{int(elapsed / 60)} minutes"
         else:
-            return f"{duration.total_seconds() / 3600:.1f} hours"
+            return f"{elapsed / 3600:.1f} hours"
     
     def get_lockdown_status(self) -> Dict:
         """Get current lockdown status"""
@@ -237,6 +303,10 @@ def unlock_topics():
 def check_query(query: str) -> tuple[bool, str]:
     """Check if query is allowed under current lockdown"""
     interface = get_lockdown_interface()
+    # No lockdown is the steady state for most sessions - answer it
+    # with one attribute test instead of a full process_query call
+    if not interface.locked:
+        return True, ""
     return interface.process_query(query)
 
 def lockdown_status() -> Dict:
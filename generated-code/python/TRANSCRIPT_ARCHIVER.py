@@ -7,31 +7,137 @@ Maintains permanent record of turtle fleet evolution and decisions
 
 import json
 import hashlib
+import queue
+import re
+import sqlite3
+import threading
 import time
 import subprocess
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields, is_dataclass
+
+try:
+    import orjson  # ~10x serialize / ~2x parse over stdlib json
+except ImportError:
+    orjson = None
+
+def _json_default(obj):
+    """Stdlib fallback matching orjson's native handling: dataclasses
+    as objects without underscore fields, datetimes as ISO strings"""
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name)
+                for f in fields(obj) if not f.name.startswith('_')}
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"not JSON serializable: {type(obj).__name__}")
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to bytes once; the writer hands the OS a single buffer
+
+    Dataclasses go straight in - orjson walks them in C, and the
+    stdlib path converts lazily via default= instead of building a
+    full intermediate dict tree up front.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None,
+                      default=_json_default).encode()
+
+def _json_loads(data: bytes):
+    return (orjson or json).loads(data)
+
+_WORD_RE = re.compile(r"\w+")
+
+# ASCII lowercase table for raw JSON bytes - bytes.translate is a C
+# scan with no intermediate str decode
+_LOWER_TABLE = bytes.maketrans(
+    bytes(range(ord('A'), ord('Z') + 1)),
+    bytes(range(ord('a'), ord('z') + 1)))
+
+@lru_cache(maxsize=64)
+def _load_session_cached(path_str: str, mtime_ns: int):
+    """Parse a session file once per on-disk version
+
+    Live sessions exist only as a segment append log until end_session
+    snapshots them; reconstruct an equivalent session dict from the
+    log so readers see one shape.
+    """
+    path = Path(path_str)
+    if path.suffix == ".ndjson":
+        segments = [_json_loads(line)
+                    for line in path.read_bytes().splitlines() if line]
+        start_time = None
+        if segments:
+            first = segments[0]
+            start_time = (first.get("timestamp")
+                          or _ns_to_iso(first["timestamp_ns"]))
+        return {
+            "session_id": path.stem,
+            "start_time": start_time,
+            "segments": segments
+        }
+    return _json_loads(path.read_bytes())
+
+# Simple keyword-based topic extraction (could be enhanced with NLP)
+_TOPIC_KEYWORDS = {
+    "turtle_spawning": ["spawn", "turtle", "process", "fleet"],
+    "category_theory": ["category", "morphism", "functor", "categorical"],
+    "distributed_systems": ["distributed", "coordination", "CAP", "consensus"],
+    "llm_integration": ["llm", "claude", "openai", "bedrock", "model"],
+    "business_process": ["business", "organization", "workflow", "enterprise"],
+    "research_publication": ["paper", "research", "publish", "academic"]
+}
+
+# All keywords fused into one alternation: a session is scanned once at
+# C speed instead of once per keyword per topic. Matching stays
+# case-sensitive against lowercased content, exactly like the old
+# substring checks.
+_TOPIC_RE = re.compile('|'.join(
+    re.escape(keyword)
+    for keywords in _TOPIC_KEYWORDS.values()
+    for keyword in sorted(keywords, key=len, reverse=True)))
+_TOPIC_BITS = {topic: 1 << i for i, topic in enumerate(_TOPIC_KEYWORDS)}
+_KEYWORD_BIT = {
+    keyword: _TOPIC_BITS[topic]
+    for topic, keywords in _TOPIC_KEYWORDS.items()
+    for keyword in keywords
+}
+
+def _topic_mask(content_lower: str) -> int:
+    """Topic bits hit by one piece of content, in a single scan"""
+    mask = 0
+    for keyword in _TOPIC_RE.findall(content_lower):
+        mask |= _KEYWORD_BIT[keyword]
+    return mask
+
+def _ns_to_iso(timestamp_ns: int) -> str:
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc).isoformat()
 
 @dataclass
 class ConversationSegment:
     """Individual conversation segment"""
     segment_id: str
-    timestamp: datetime
+    # Raw clock reading: time.time_ns() is an int with no object
+    # allocation, and buffer-age checks stay pure integer arithmetic.
+    # A datetime is only materialized on demand via the property.
+    timestamp_ns: int
     participant: str  # "human" or "turtle_id"
     content: str
     metadata: Dict[str, Any]
+    # Derived once at ingest while the content is small and cache-warm;
+    # session-level extraction just ORs these together
+    topic_mask: int = 0
     
-    def to_dict(self):
-        return {
-            "segment_id": self.segment_id,
-            "timestamp": self.timestamp.isoformat(),
-            "participant": self.participant,
-            "content": self.content,
-            "metadata": self.metadata
-        }
+    @property
+    def timestamp(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
 
 @dataclass
 class ConversationSession:
@@ -42,16 +148,12 @@ class ConversationSession:
     participants: List[str]
     segments: List[ConversationSegment]
     session_metadata: Dict[str, Any]
+    # Still rendered eagerly: the daily and index records want the
+    # string repeatedly outside of serialization
+    _start_iso: str = field(init=False, repr=False)
     
-    def to_dict(self):
-        return {
-            "session_id": self.session_id,
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat() if self.end_time else None,
-            "participants": self.participants,
-            "segments": [seg.to_dict() for seg in self.segments],
-            "session_metadata": self.session_metadata
-        }
+    def __post_init__(self):
+        self._start_iso = self.start_time.isoformat()
 
 class TurtleTranscriptArchiver:
     """Archives turtle conversations recursively"""
@@ -60,8 +162,24 @@ class TurtleTranscriptArchiver:
         self.archive_repo_path = Path(archive_repo_path).resolve()
         self.current_session: Optional[ConversationSession] = None
         self.archive_buffer: List[ConversationSegment] = []
+        # Daily summary and metadata index both want the session topics
+        # on every flush; cache them and rescan only after new segments
+        self._topics_cache: Optional[List[str]] = None
+        self._topics_dirty = True
+        # Days whose append log has records the consolidated summary
+        # hasn't absorbed yet
+        self._dirty_daily_dates: set = set()
         
         # Archive configuration
+        # Local commits accumulate; one push at end_session (or on the
+        # next flush after this is set) amortizes the network RTT
+        self._push_pending = False
+        # One long-lived worker owns all git children: flushes enqueue a
+        # commit message and return immediately instead of paying
+        # fork+exec three times inline
+        self._git_q: queue.Queue = queue.Queue()
+        threading.Thread(target=self._git_worker, daemon=True).start()
+        
         self.config = {
             "buffer_size": 50,           # Archive every N segments
             "time_threshold": 300,       # Archive every 5 minutes
@@ -72,23 +190,49 @@ class TurtleTranscriptArchiver:
             "compression": True          # Compress old archives
         }
         
+        # One alternation over every filter term: content is scanned
+        # once instead of lowered and swept once per term
+        self._filter_re = re.compile(
+            '|'.join(re.escape(term) for term in
+                     sorted(self.config["privacy_filters"], key=len, reverse=True)),
+            re.IGNORECASE | re.ASCII)
+        self._placeholders = {
+            term.lower(): f"[FILTERED_{term.upper()}]"
+            for term in self.config["privacy_filters"]
+        }
+        
+        # Inverted token index: search touches only sessions whose
+        # postings match instead of parsing the whole archive
+        self._postings_db: Optional[sqlite3.Connection] = None
+        
         self.initialize_archive_repo()
     
+    @staticmethod
+    def _atomic_write_bytes(path: Path, data: bytes):
+        """Serialize-once write that can't leave a torn file
+
+        One write_bytes of the full buffer plus an os.replace rename:
+        a crash mid-write leaves the old file intact, and readers never
+        observe a partially written archive.
+        """
+        tmp = path.with_suffix(path.suffix + '.tmp')
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    
     def initialize_archive_repo(self):
         """Initialize transcript archive repository"""
         if not self.archive_repo_path.exists():
             print(f"❌ Archive repo not found at {self.archive_repo_path}")
             return
         
-        os.chdir(self.archive_repo_path)
-        
-        # Ensure archive structure
+        # Ensure archive structure (absolute paths - mutating the
+        # process-global cwd would race any other thread or archiver)
         archive_dirs = ["sessions", "daily", "compressed", "metadata"]
         for dir_name in archive_dirs:
-            Path(dir_name).mkdir(exist_ok=True)
+            (self.archive_repo_path / dir_name).mkdir(exist_ok=True)
         
         # Create README if it doesn't exist
-        readme_path = Path("README.md")
+        readme_path = self.archive_repo_path / "README.md"
         if not readme_path.exists():
             with open(readme_path, 'w') as f:
                 f.write("""# 🐢 Turtle Transcript Archive
@@ -106,11 +250,23 @@ All sensitive content is filtered before archiving.
 This repository contains conversation transcripts for turtle development purposes.
 """)
         
+        self._postings_db = sqlite3.connect(
+            self.archive_repo_path / "metadata" / "postings.sqlite")
+        self._postings_db.execute(
+            "CREATE TABLE IF NOT EXISTS postings "
+            "(token TEXT, session_id TEXT, segment_id TEXT)")
+        self._postings_db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_postings_token ON postings(token)")
+        self._postings_db.commit()
+        
         print(f"📚 Archive repository initialized at {self.archive_repo_path}")
     
     def start_session(self, session_metadata: Dict[str, Any] = None) -> str:
         """Start new conversation session"""
-        session_id = hashlib.md5(f"session_{time.time()}".encode()).hexdigest()[:12]
+        # blake2b with a truncated digest: faster than MD5 and emits
+        # exactly the bytes we keep instead of hashing wide and slicing
+        session_id = hashlib.blake2b(
+            f"session_{time.time()}".encode(), digest_size=6).hexdigest()
         
         self.current_session = ConversationSession(
             session_id=session_id,
@@ -121,6 +277,9 @@ This repository contains conversation transcripts for turtle development purpose
             session_metadata=session_metadata or {}
         )
         
+        self._topics_cache = None
+        self._topics_dirty = True
+        
         print(f"📝 Started conversation session: {session_id}")
         return session_id
     
@@ -133,15 +292,29 @@ This repository contains conversation transcripts for turtle development purpose
         filtered_content = self.filter_sensitive_content(content)
         
         segment = ConversationSegment(
-            segment_id=hashlib.md5(f"{participant}_{time.time()}_{filtered_content[:50]}".encode()).hexdigest()[:8],
-            timestamp=datetime.utcnow(),
+            segment_id=hashlib.blake2b(
+                f"{participant}_{time.time()}_{filtered_content[:50]}".encode(),
+                digest_size=4).hexdigest(),
+            timestamp_ns=time.time_ns(),
             participant=participant,
             content=filtered_content,
-            metadata=metadata or {}
+            metadata=metadata or {},
+            topic_mask=_topic_mask(filtered_content.lower())
         )
         
         self.current_session.segments.append(segment)
         self.archive_buffer.append(segment)
+        self._topics_dirty = True
+        
+        # Index the segment's tokens as it arrives - O(segment) here
+        # instead of O(archive) at query time
+        if self._postings_db is not None:
+            tokens = set(_WORD_RE.findall(filtered_content.lower()))
+            self._postings_db.executemany(
+                "INSERT INTO postings VALUES (?, ?, ?)",
+                [(token, self.current_session.session_id, segment.segment_id)
+                 for token in tokens])
+            self._postings_db.commit()
         
         # Add participant to session participants
         if participant not in self.current_session.participants:
@@ -154,24 +327,17 @@ This repository contains conversation transcripts for turtle development purpose
     
     def filter_sensitive_content(self, content: str) -> str:
         """Filter sensitive content from conversations"""
-        filtered = content
-        
-        for sensitive_term in self.config["privacy_filters"]:
-            if sensitive_term.lower() in filtered.lower():
-                # Replace with placeholder
-                filtered = filtered.replace(sensitive_term, f"[FILTERED_{sensitive_term.upper()}]")
-        
-        return filtered
+        return self._filter_re.sub(
+            lambda m: self._placeholders[m.group(0).lower()], content)
     
     def _should_archive_by_time(self) -> bool:
         """Check if enough time has passed to trigger archiving"""
         if not self.archive_buffer:
             return False
         
-        oldest_segment = min(self.archive_buffer, key=lambda s: s.timestamp)
-        time_diff = datetime.utcnow() - oldest_segment.timestamp
-        
-        return time_diff.total_seconds() > self.config["time_threshold"]
+        # Pure integer comparison - no datetime or timedelta objects
+        oldest_ns = min(segment.timestamp_ns for segment in self.archive_buffer)
+        return time.time_ns() - oldest_ns > self.config["time_threshold"] * 1_000_000_000
     
     def archive_current_buffer(self):
         """Archive current conversation buffer"""
@@ -180,11 +346,14 @@ This repository contains conversation transcripts for turtle development purpose
         
         print(f"📚 Archiving {len(self.archive_buffer)} conversation segments...")
         
-        # Create session archive
-        session_file = self.archive_repo_path / "sessions" / f"{self.current_session.session_id}.json"
-        
-        with open(session_file, 'w') as f:
-            json.dump(self.current_session.to_dict(), f, indent=2)
+        # Append only the buffered segments - O(buffer) bytes written
+        # per flush instead of rewriting the whole session, which made
+        # total write work quadratic in session length. end_session
+        # snapshots the consolidated JSON once.
+        log_file = self.archive_repo_path / "sessions" / f"{self.current_session.session_id}.ndjson"
+        with open(log_file, 'ab') as f:
+            for segment in self.archive_buffer:
+                f.write(_json_dumps(segment) + b"\n")
         
         # Create daily summary entry
         self._update_daily_summary()
@@ -192,9 +361,9 @@ This repository contains conversation transcripts for turtle development purpose
         # Update metadata index
         self._update_metadata_index()
         
-        # Commit to git if configured
+        # Commit to git if configured; pushing waits for end_session
         if self.config["auto_commit"]:
-            self._commit_to_git()
+            self._stage_and_commit_local()
         
         # Clear buffer
         self.archive_buffer.clear()
@@ -202,121 +371,181 @@ This repository contains conversation transcripts for turtle development purpose
         print(f"✅ Archived session {self.current_session.session_id}")
     
     def _update_daily_summary(self):
-        """Update daily conversation summary"""
-        today = datetime.utcnow().date()
-        daily_file = self.archive_repo_path / "daily" / f"{today.isoformat()}.json"
-        
-        # Load existing daily summary or create new
-        if daily_file.exists():
-            with open(daily_file, 'r') as f:
-                daily_summary = json.load(f)
-        else:
-            daily_summary = {
-                "date": today.isoformat(),
-                "sessions": [],
-                "total_segments": 0,
-                "participants": set(),
-                "topics": []
-            }
-        
-        # Add current session to daily summary
-        daily_summary["sessions"].append({
+        """Append this flush's daily record; consolidation happens later
+
+        The daily summary was another read-modify-write file that grew
+        with the day's traffic. A flush now appends one NDJSON record -
+        O(1) regardless of how busy the day was - and
+        _consolidate_daily folds the log into daily/<date>.json once
+        per session.
+        """
+        today_iso = datetime.utcnow().date().isoformat()
+        record = {
             "session_id": self.current_session.session_id,
-            "start_time": self.current_session.start_time.isoformat(),
+            "start_time": self.current_session._start_iso,
             "segment_count": len(self.current_session.segments),
-            "participants": self.current_session.participants
-        })
-        
-        daily_summary["total_segments"] += len(self.archive_buffer)
-        daily_summary["participants"] = list(set(daily_summary["participants"]) | set(self.current_session.participants))
-        
-        # Extract topics (simplified - could be enhanced with NLP)
-        session_topics = self._extract_topics_from_session()
-        daily_summary["topics"].extend(session_topics)
-        
-        # Convert set back to list for JSON serialization
-        if isinstance(daily_summary["participants"], set):
-            daily_summary["participants"] = list(daily_summary["participants"])
+            "new_segments": len(self.archive_buffer),
+            "participants": self.current_session.participants,
+            "topics": self._extract_topics_from_session()
+        }
+        ndjson_file = self.archive_repo_path / "daily" / f"{today_iso}.ndjson"
+        with open(ndjson_file, 'ab') as f:
+            f.write(_json_dumps(record) + b"\n")
+        self._dirty_daily_dates.add(today_iso)
+    
+    def _consolidate_daily(self, date_iso: str):
+        """Rebuild daily/<date>.json from the day's append log
+
+        The latest record per session wins for session facts; segment
+        totals accumulate across every flush, matching the old
+        per-flush increments.
+        """
+        ndjson_file = self.archive_repo_path / "daily" / f"{date_iso}.ndjson"
+        if not ndjson_file.exists():
+            return
         
-        with open(daily_file, 'w') as f:
-            json.dump(daily_summary, f, indent=2)
+        sessions: Dict[str, Dict[str, Any]] = {}
+        total_segments = 0
+        with open(ndjson_file, 'rb') as f:
+            for line in f:
+                record = _json_loads(line)
+                total_segments += record["new_segments"]
+                sessions[record["session_id"]] = record
+        
+        daily_summary = {
+            "date": date_iso,
+            "sessions": [{
+                "session_id": record["session_id"],
+                "start_time": record["start_time"],
+                "segment_count": record["segment_count"],
+                "participants": record["participants"]
+            } for record in sessions.values()],
+            "total_segments": total_segments,
+            "participants": {},
+            "topics": []
+        }
+        for record in sessions.values():
+            for participant in record["participants"]:
+                daily_summary["participants"].setdefault(participant, 1)
+            for topic in record["topics"]:
+                if topic not in daily_summary["topics"]:
+                    daily_summary["topics"].append(topic)
+        
+        daily_file = self.archive_repo_path / "daily" / f"{date_iso}.json"
+        self._atomic_write_bytes(daily_file, _json_dumps(daily_summary, indent=True))
     
     def _extract_topics_from_session(self) -> List[str]:
         """Extract topics from current session (simplified)"""
-        topics = []
-        
-        # Simple keyword-based topic extraction
-        topic_keywords = {
-            "turtle_spawning": ["spawn", "turtle", "process", "fleet"],
-            "category_theory": ["category", "morphism", "functor", "categorical"],
-            "distributed_systems": ["distributed", "coordination", "CAP", "consensus"],
-            "llm_integration": ["llm", "claude", "openai", "bedrock", "model"],
-            "business_process": ["business", "organization", "workflow", "enterprise"],
-            "research_publication": ["paper", "research", "publish", "academic"]
+        if not self._topics_dirty:
+            return self._topics_cache
+        
+        # The scanning already happened per segment at ingest; flush
+        # time is an OR over the stored masks plus a bit decode
+        mask = 0
+        for segment in self.current_session.segments:
+            mask |= segment.topic_mask
+        
+        self._topics_cache = [
+            topic for topic, bit in _TOPIC_BITS.items() if mask & bit]
+        self._topics_dirty = False
+        return self._topics_cache
+    
+    def _update_metadata_index(self):
+        """Append this session's index record; compaction happens later
+
+        The old read-modify-write of metadata/index.json cost
+        O(total sessions ever archived) per flush. Appending one NDJSON
+        line is O(1); _compact_index rebuilds the aggregate view once
+        per session at end_session.
+        """
+        record = {
+            "session_id": self.current_session.session_id,
+            "date": self.current_session._start_iso[:10],
+            "segments": len(self.current_session.segments),
+            "participants": self.current_session.participants,
+            "topics": self._extract_topics_from_session()
         }
+        ndjson_file = self.archive_repo_path / "metadata" / "index.ndjson"
+        with open(ndjson_file, 'ab') as f:
+            f.write(_json_dumps(record) + b"\n")
+    
+    def _compact_index(self):
+        """Rebuild metadata/index.json from the append log
+
+        One streaming pass; the latest record per session wins, so a
+        session flushed several times counts once with its final
+        segment tally.
+        """
+        ndjson_file = self.archive_repo_path / "metadata" / "index.ndjson"
+        if not ndjson_file.exists():
+            return
         
-        all_content = " ".join(segment.content.lower() for segment in self.current_session.segments)
-        
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in all_content for keyword in keywords):
-                topics.append(topic)
+        sessions: Dict[str, Dict[str, Any]] = {}
+        with open(ndjson_file, 'rb') as f:
+            for line in f:
+                record = _json_loads(line)
+                sessions[record["session_id"]] = record
+        
+        index = {
+            "total_sessions": len(sessions),
+            "total_segments": 0,
+            "date_range": {"start": None, "end": None},
+            "participants": {},
+            "topics": {},
+            "sessions_by_date": {}
+        }
+        for session_id, record in sessions.items():
+            index["total_segments"] += record["segments"]
+            session_date = record["date"]
+            if not index["date_range"]["start"] or session_date < index["date_range"]["start"]:
+                index["date_range"]["start"] = session_date
+            if not index["date_range"]["end"] or session_date > index["date_range"]["end"]:
+                index["date_range"]["end"] = session_date
+            for participant in record["participants"]:
+                index["participants"][participant] = index["participants"].get(participant, 0) + 1
+            for topic in record["topics"]:
+                index["topics"][topic] = index["topics"].get(topic, 0) + 1
+            index["sessions_by_date"].setdefault(session_date, []).append(session_id)
         
-        return topics
-    
-    def _update_metadata_index(self):
-        """Update searchable metadata index"""
         index_file = self.archive_repo_path / "metadata" / "index.json"
-        
-        if index_file.exists():
-            with open(index_file, 'r') as f:
-                index = json.load(f)
-        else:
-            index = {
-                "total_sessions": 0,
-                "total_segments": 0,
-                "date_range": {"start": None, "end": None},
-                "participants": {},
-                "topics": {},
-                "sessions_by_date": {}
-            }
-        
-        # Update index with current session
-        index["total_sessions"] += 1
-        index["total_segments"] += len(self.current_session.segments)
-        
-        session_date = self.current_session.start_time.date().isoformat()
-        if not index["date_range"]["start"] or session_date < index["date_range"]["start"]:
-            index["date_range"]["start"] = session_date
-        if not index["date_range"]["end"] or session_date > index["date_range"]["end"]:
-            index["date_range"]["end"] = session_date
-        
-        # Update participant counts
-        for participant in self.current_session.participants:
-            index["participants"][participant] = index["participants"].get(participant, 0) + 1
-        
-        # Update topic counts
-        session_topics = self._extract_topics_from_session()
-        for topic in session_topics:
-            index["topics"][topic] = index["topics"].get(topic, 0) + 1
-        
-        # Update sessions by date
-        if session_date not in index["sessions_by_date"]:
-            index["sessions_by_date"][session_date] = []
-        index["sessions_by_date"][session_date].append(self.current_session.session_id)
-        
-        with open(index_file, 'w') as f:
-            json.dump(index, f, indent=2)
-    
-    def _commit_to_git(self):
-        """Commit archives to git repository"""
-        try:
-            os.chdir(self.archive_repo_path)
-            
-            # Add all changes
-            subprocess.run(["git", "add", "."], check=True, capture_output=True)
-            
-            # Create commit message
-            commit_message = f"""Archive conversation session {self.current_session.session_id}
+        self._atomic_write_bytes(index_file, _json_dumps(index, indent=True))
+    
+    def _git_worker(self):
+        """Consume queued commits on a dedicated thread
+
+        Stage+commit run as one shell pipeline - a single fork+exec
+        instead of two - and off the caller's thread, so a buffer flush
+        costs queue-put time rather than subprocess time.
+        """
+        while True:
+            commit_message = self._git_q.get()
+            try:
+                if commit_message is None:
+                    break
+                # A queued commit may find nothing staged when an
+                # earlier one already swept up the same files; that is
+                # coalescing working as intended, not a failure
+                subprocess.run(
+                    ["sh", "-c",
+                     'git add . && { git diff --cached --quiet || git commit -m "$MSG"; }'],
+                    env={**os.environ, "MSG": commit_message},
+                    cwd=self.archive_repo_path,
+                    check=True, capture_output=True)
+                self._push_pending = True
+            except subprocess.CalledProcessError as e:
+                print(f"❌ Git commit failed: {e}")
+            finally:
+                self._git_q.task_done()
+    
+    def _stage_and_commit_local(self):
+        """Queue a stage+commit for the git worker; the push is deferred
+
+        Every buffer flush used to block on three subprocesses ending
+        in a full git push over the network. The commit now happens on
+        the worker thread and the remote round-trip happens once per
+        session in _flush_push.
+        """
+        commit_message = f"""Archive conversation session {self.current_session.session_id}
 
 Session: {self.current_session.session_id}
 Segments: {len(self.current_session.segments)}
@@ -325,18 +554,24 @@ Duration: {datetime.utcnow() - self.current_session.start_time}
 
 🐢 Turtle Transcript Archiver - Recursive conversation preservation
 """
-            
-            # Commit changes
-            subprocess.run(["git", "commit", "-m", commit_message], 
-                          check=True, capture_output=True)
-            
-            # Push to remote
-            subprocess.run(["git", "push"], check=True, capture_output=True)
-            
-            print(f"🚀 Committed and pushed archive for session {self.current_session.session_id}")
-            
+        
+        self._git_q.put(commit_message)
+        print(f"📦 Queued archive commit for session {self.current_session.session_id} (push deferred)")
+    
+    def _flush_push(self):
+        """Push all accumulated local commits in one network round-trip"""
+        # Wait for queued commits so the push sees all of them
+        self._git_q.join()
+        if not self._push_pending:
+            return
+        
+        try:
+            subprocess.run(["git", "push"], cwd=self.archive_repo_path,
+                           check=True, capture_output=True)
+            self._push_pending = False
+            print("🚀 Pushed accumulated archive commits")
         except subprocess.CalledProcessError as e:
-            print(f"❌ Git commit failed: {e}")
+            print(f"❌ Git push failed: {e}")
     
     def end_session(self):
         """End current conversation session"""
@@ -350,16 +585,63 @@ Duration: {datetime.utcnow() - self.current_session.start_time}
         # Set end time
         self.current_session.end_time = datetime.utcnow()
         
-        # Final archive
+        # Snapshot the consolidated session and retire the append log
         session_file = self.archive_repo_path / "sessions" / f"{self.current_session.session_id}.json"
-        with open(session_file, 'w') as f:
-            json.dump(self.current_session.to_dict(), f, indent=2)
+        self._atomic_write_bytes(session_file, _json_dumps(self.current_session, indent=True))
+        log_file = session_file.with_suffix(".ndjson")
+        if log_file.exists():
+            log_file.unlink()
+        
+        # Fold the append logs into their consolidated views once per
+        # session
+        self._compact_index()
+        for date_iso in sorted(self._dirty_daily_dates):
+            self._consolidate_daily(date_iso)
+        self._dirty_daily_dates.clear()
         
         if self.config["auto_commit"]:
-            self._commit_to_git()
+            self._stage_and_commit_local()
+            self._flush_push()
         
         print(f"📚 Session {self.current_session.session_id} ended and archived")
         self.current_session = None
+        self._topics_cache = None
+        self._topics_dirty = True
+    
+    def _candidate_session_files(self, query: str) -> List[Path]:
+        """Narrow the search to sessions whose postings hold every token
+
+        Falls back to the full glob when the index can't vouch for the
+        query (no tokens, no index, or an empty intersection - substring
+        queries can straddle token boundaries the index doesn't see).
+        """
+        sessions_dir = self.archive_repo_path / "sessions"
+        full_scan = sorted(sessions_dir.glob("*.json"))
+        # Sessions not yet snapshotted are visible through their logs
+        snapshotted = {path.stem for path in full_scan}
+        full_scan += sorted(path for path in sessions_dir.glob("*.ndjson")
+                            if path.stem not in snapshotted)
+        
+        tokens = set(_WORD_RE.findall(query.lower()))
+        if self._postings_db is None or not tokens:
+            return full_scan
+        
+        candidates: Optional[set] = None
+        for token in tokens:
+            rows = {session_id for (session_id,) in self._postings_db.execute(
+                "SELECT DISTINCT session_id FROM postings WHERE token = ?",
+                (token,))}
+            candidates = rows if candidates is None else candidates & rows
+        if not candidates:
+            return full_scan
+        
+        # The index can only rule out sessions it has postings for;
+        # archives written before the index existed must stay in the
+        # scan or upgrading silently loses their search results
+        indexed = {session_id for (session_id,) in self._postings_db.execute(
+            "SELECT DISTINCT session_id FROM postings")}
+        return [path for path in full_scan
+                if path.stem in candidates or path.stem not in indexed]
     
     def search_transcripts(self, query: str, date_range: Optional[tuple] = None) -> List[Dict]:
         """Search archived transcripts"""
@@ -369,9 +651,21 @@ Duration: {datetime.utcnow() - self.current_session.start_time}
         if not sessions_dir.exists():
             return results
         
-        for session_file in sessions_dir.glob("*.json"):
-            with open(session_file, 'r') as f:
-                session_data = json.load(f)
+        # Queries made only of characters JSON never escapes can be
+        # checked against the raw bytes - a miss skips the parse
+        # entirely. Quotes, backslashes and non-ASCII may be escaped
+        # on disk, so those queries go straight to the parsed path.
+        query_bytes = None
+        if query.isascii() and query.isprintable() and '"' not in query and '\\' not in query:
+            query_bytes = query.lower().encode()
+        
+        for session_file in self._candidate_session_files(query):
+            if query_bytes is not None:
+                raw = session_file.read_bytes()
+                if query_bytes not in raw.translate(_LOWER_TABLE):
+                    continue
+            session_data = _load_session_cached(
+                str(session_file), session_file.stat().st_mtime_ns)
             
             # Date filtering
             if date_range:
@@ -382,10 +676,14 @@ Duration: {datetime.utcnow() - self.current_session.start_time}
             # Content search
             for segment in session_data["segments"]:
                 if query.lower() in segment["content"].lower():
+                    # Older archives stored an ISO timestamp; current
+                    # ones store raw nanoseconds
+                    timestamp = (segment.get("timestamp")
+                                 or _ns_to_iso(segment["timestamp_ns"]))
                     results.append({
                         "session_id": session_data["session_id"],
                         "segment_id": segment["segment_id"],
-                        "timestamp": segment["timestamp"],
+                        "timestamp": timestamp,
                         "participant": segment["participant"],
                         "content": segment["content"][:200] + "..." if len(segment["content"]) > 200 else segment["content"],
                         "match_score": segment["content"].lower().count(query.lower())
@@ -400,9 +698,7 @@ Duration: {datetime.utcnow() - self.current_session.start_time}
         index_file = self.archive_repo_path / "metadata" / "index.json"
         
         if index_file.exists():
-            with open(index_file, 'r') as f:
-                index = json.load(f)
-            return index
+            return _json_loads(index_file.read_bytes())
         else:
             return {"message": "No archive index found"}
 